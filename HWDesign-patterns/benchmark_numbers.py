@@ -0,0 +1,188 @@
+# Набор бенчмарков для конвейера чисел из Задания №2 (patterns/number_pipeline.py).
+# Генерирует файлы с числами заданных размеров, замеряет основные операции
+# и сохраняет результаты в JSON, чтобы сравнивать их между версиями.
+#
+# Пример:
+#   python benchmark_numbers.py --sizes 1000 100000 1000000 --output bench.json
+#   python benchmark_numbers.py --baseline bench.json --tolerance 0.2
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from patterns import number_pipeline
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+APPEND_LINES = 1_000
+WARM_CALLS = 100
+
+
+def generate_number_file(path: Path, count: int, seed: int) -> None:
+    """Файл из count случайных чисел, по одному на строку; одинаковый seed даёт одинаковый файл"""
+    rng = random.Random(seed)
+    block = 100_000
+    with open(path, 'w', encoding='utf-8') as file:
+        for start in range(0, count, block):
+            size = min(block, count - start)
+            file.write('\n'.join(str(rng.randint(-10 ** 9, 10 ** 9)) for _ in range(size)))
+            file.write('\n')
+
+
+def measure(function: Callable[[], Any], repeat: int,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """Время выполнения function в секундах; setup выполняется перед каждым замером и не учитывается"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {'min_s': min(timings), 'median_s': statistics.median(timings), 'max_s': max(timings)}
+
+
+def run_size(path: Path, size: int, repeat: int) -> List[Dict[str, Any]]:
+    results = []
+
+    def record(name: str, timing: Dict[str, float], calls: int = 1) -> None:
+        # Для многократных вызовов сохраняем время одного вызова
+        results.append({'benchmark': name, 'size': size, 'repeat': repeat,
+                        **{key: value / calls for key, value in timing.items()}})
+
+    record('cold_load_fast', measure(lambda: number_pipeline.FileNumberDataSource(str(path)), repeat))
+    record('cold_load_line_by_line',
+           measure(lambda: number_pipeline.FileNumberDataSource(str(path), fast_load=False), repeat))
+
+    cache_path = Path(f"{path}.cache")
+    number_pipeline.FileNumberDataSource(str(path), use_cache=True)
+    record('cold_load_from_cache',
+           measure(lambda: number_pipeline.FileNumberDataSource(str(path), use_cache=True), repeat))
+    cache_path.unlink()
+
+    source = number_pipeline.FileNumberDataSource(str(path))
+    record('warm_get_numbers',
+           measure(lambda: [source.get_numbers() for _ in range(WARM_CALLS)], repeat), WARM_CALLS)
+    record('warm_get_numbers_view',
+           measure(lambda: [source.get_numbers_view() for _ in range(WARM_CALLS)], repeat), WARM_CALLS)
+
+    service = number_pipeline.NumberOperationsService(source)
+    record('perform_all_operations_cold',
+           measure(service.perform_all_operations, repeat,
+                   setup=lambda: setattr(service, '_aggregates_cache', None)))
+    record('perform_all_operations_warm',
+           measure(lambda: [service.perform_all_operations() for _ in range(WARM_CALLS)], repeat),
+           WARM_CALLS)
+
+    # Дописывание в конец файла и обнаружение изменения при следующем чтении
+    incremental = number_pipeline.FileNumberDataSource(str(path), incremental=True)
+    incremental_service = number_pipeline.NumberOperationsService(incremental)
+    incremental_service.get_aggregates()
+    tail = ''.join(f"{i}\n" for i in range(APPEND_LINES))
+
+    def append_tail() -> None:
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(tail)
+
+    record('reload_after_append_incremental',
+           measure(incremental_service.get_aggregates, repeat, setup=append_tail))
+    full = number_pipeline.FileNumberDataSource(str(path))
+    full_service = number_pipeline.NumberOperationsService(full)
+    record('reload_after_append_full',
+           measure(full_service.get_aggregates, repeat, setup=append_tail))
+
+    # Накладные расходы прокси с логированием относительно прямого доступа
+    proxy = number_pipeline.LoggingNumberDataSourceProxy(source)
+    record('logging_proxy_get_numbers_view',
+           measure(lambda: [proxy.get_numbers_view() for _ in range(WARM_CALLS)], repeat), WARM_CALLS)
+    sampled_proxy = number_pipeline.LoggingNumberDataSourceProxy(source, sample_rate=0.01)
+    record('sampled_proxy_get_numbers_view',
+           measure(lambda: [sampled_proxy.get_numbers_view() for _ in range(WARM_CALLS)], repeat),
+           WARM_CALLS)
+    return results
+
+
+def compare_with_baseline(results: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> int:
+    """Печатает изменение медианы относительно сохранённого прогона; возвращает число регрессий"""
+    with open(baseline_path, 'r', encoding='utf-8') as file:
+        baseline = {(item['benchmark'], item['size']): item for item in json.load(file)['results']}
+
+    regressions = 0
+    for item in results:
+        previous = baseline.get((item['benchmark'], item['size']))
+        if previous is None or not previous['median_s']:
+            continue
+        ratio = item['median_s'] / previous['median_s']
+        marker = ''
+        if ratio > 1 + tolerance:
+            marker = '  <-- REGRESSION'
+            regressions += 1
+        print(f"{item['benchmark']:<36} {item['size']:>12} {ratio:7.2f}x{marker}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks for the number data pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="number of lines in generated files (up to 100000000)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="write JSON results to this file")
+    parser.add_argument('--workdir', help="directory for generated files (temporary by default)")
+    parser.add_argument('--baseline', help="JSON results of a previous run to compare with")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown relative to the baseline, 0.2 = 20%%")
+    args = parser.parse_args(argv)
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workdir = Path(args.workdir or temp_dir).resolve()
+        workdir.mkdir(parents=True, exist_ok=True)
+        previous_cwd = os.getcwd()
+        # Лог прокси пишется в текущий каталог - не засоряем рабочую копию
+        os.chdir(workdir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                number_pipeline.Logger().configure(echo=False)
+            for size in args.sizes:
+                path = workdir / f"numbers_{size}.txt"
+                generate_number_file(path, size, args.seed)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results.extend(run_size(path, size, args.repeat))
+                path.unlink()
+                print(f"size {size}: done", file=sys.stderr)
+        finally:
+            number_pipeline.Logger().close()
+            os.chdir(previous_cwd)
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'seed': args.seed,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        return 1 if compare_with_baseline(results, args.baseline, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
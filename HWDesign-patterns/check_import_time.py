@@ -0,0 +1,83 @@
+# Проверка времени импорта модулей пакета patterns.
+# Каждый модуль импортируется в отдельном процессе (python -X importtime) из пустого
+# временного каталога: импорт не должен ничего печатать и создавать файлы,
+# а медиана времени импорта не должна превышать бюджет.
+#
+# Пример:
+#   python check_import_time.py --runs 7 --output import_times.json
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Бюджет на импорт модуля вместе с зависимостями, в миллисекундах
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    'patterns.command': 20,
+    'patterns.number_pipeline': 70,
+    'patterns.number_async': 120,
+    'patterns.library': 50,
+    'patterns.builder': 25,
+    'patterns.pasta': 30,
+    'patterns.prototype': 30,
+}
+
+
+def measure_import(module: str, package_dir: Path) -> float:
+    """Одно измерение в миллисекундах; бросает RuntimeError при выводе или создании файлов"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        env = dict(os.environ, PYTHONPATH=str(package_dir))
+        # Измеряем импорт из байткода, как при обычном запуске
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                                   cwd=work_dir, env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{completed.stderr}")
+        if completed.stdout:
+            raise RuntimeError(f"import {module} printed: {completed.stdout!r}")
+        created = os.listdir(work_dir)
+        if created:
+            raise RuntimeError(f"import {module} created files: {created}")
+
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no importtime record for {module}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check import time of the patterns package")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    package_dir = Path(__file__).resolve().parent
+    # Первый импорт компилирует байткод - его не учитываем
+    for module in IMPORT_BUDGETS_MS:
+        measure_import(module, package_dir)
+
+    results = []
+    over_budget = 0
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        median = statistics.median(measure_import(module, package_dir) for _ in range(args.runs))
+        status = 'ok' if median <= budget else 'OVER BUDGET'
+        if median > budget:
+            over_budget += 1
+        results.append({'module': module, 'median_ms': median, 'budget_ms': budget})
+        print(f"{module:<28} {median:8.1f} ms  (budget {budget:g} ms)  {status}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({'python': sys.version.split()[0], 'runs': args.runs, 'results': results}, file, indent=2)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+# Реализации заданий по паттернам проектирования, по одному модулю на подсистему:
+#   command          - паттерн Command (пульт и свет)
+#   number_pipeline  - доступ к набору чисел из файла: Proxy с логированием, обновление, агрегаты
+#   number_async     - асинхронный адаптер для number_pipeline
+#   library          - приложение для библиотеки
+#   builder          - паттерн Builder (сборка компьютера)
+#   pasta            - приложение для приготовления пасты
+#   prototype        - паттерн Prototype
+#
+# Импорт модулей не выполняет ввод-вывод и ничего не печатает;
+# демонстрации запускаются скриптами design-patterns.py и design-patterns_1.py
@@ -0,0 +1,236 @@
+# Задание 1. Создайте реализацию паттерна Builder.
+# Протестируйте работу созданного класса.
+
+from typing import List
+
+class Computer:
+    """Продукт - компьютер, который мы будем строить"""
+
+    def __init__(self):
+        self.cpu: str = ""
+        self.ram: int = 0
+        self.storage: int = 0
+        self.gpu: str = ""
+        self.operating_system: str = ""
+        self.peripherals: List[str] = []
+
+    def __str__(self) -> str:
+        return (f"Computer:\n"
+                f"  CPU: {self.cpu}\n"
+                f"  RAM: {self.ram}GB\n"
+                f"  Storage: {self.storage}GB\n"
+                f"  GPU: {self.gpu}\n"
+                f"  OS: {self.operating_system}\n"
+                f"  Peripherals: {', '.join(self.peripherals) if self.peripherals else 'None'}")
+
+
+class ComputerBuilder:
+    """Строитель компьютера"""
+
+    def __init__(self):
+        self.computer = Computer()
+
+    def set_cpu(self, cpu: str) -> 'ComputerBuilder':
+        """Установка процессора"""
+        self.computer.cpu = cpu
+        return self
+
+    def set_ram(self, ram: int) -> 'ComputerBuilder':
+        """Установка оперативной памяти"""
+        if ram <= 0:
+            raise ValueError("RAM must be positive")
+        self.computer.ram = ram
+        return self
+
+    def set_storage(self, storage: int) -> 'ComputerBuilder':
+        """Установка хранилища"""
+        if storage <= 0:
+            raise ValueError("Storage must be positive")
+        self.computer.storage = storage
+        return self
+
+    def set_gpu(self, gpu: str) -> 'ComputerBuilder':
+        """Установка видеокарты"""
+        self.computer.gpu = gpu
+        return self
+
+    def set_operating_system(self, os: str) -> 'ComputerBuilder':
+        """Установка операционной системы"""
+        self.computer.operating_system = os
+        return self
+
+    def add_peripheral(self, peripheral: str) -> 'ComputerBuilder':
+        """Добавление периферийного устройства"""
+        self.computer.peripherals.append(peripheral)
+        return self
+
+    def build(self) -> Computer:
+        """Построение компьютера и возврат результата"""
+        # Можно добавить валидацию здесь
+        if not self.computer.cpu:
+            raise ValueError("CPU is required")
+        if not self.computer.ram:
+            raise ValueError("RAM is required")
+
+        computer = self.computer
+        self.computer = Computer()  # Сброс для возможного повторного использования
+        return computer
+
+
+class GamingComputerBuilder(ComputerBuilder):
+    """Специализированный строитель для игровых компьютеров"""
+
+    def __init__(self):
+        super().__init__()
+
+    def set_gpu(self, gpu: str) -> 'GamingComputerBuilder':
+        """Переопределение для игровых видеокарт"""
+        self.computer.gpu = f"Gaming {gpu}"
+        return self
+
+    def add_gaming_peripherals(self) -> 'GamingComputerBuilder':
+        """Добавление игровой периферии"""
+        self.add_peripheral("Gaming Mouse")
+        self.add_peripheral("Mechanical Keyboard")
+        self.add_peripheral("Gaming Headset")
+        return self
+
+
+class OfficeComputerBuilder(ComputerBuilder):
+    """Специализированный строитель для офисных компьютеров"""
+
+    def __init__(self):
+        super().__init__()
+
+    def set_cpu(self, cpu: str) -> 'OfficeComputerBuilder':
+        """Переопределение для офисных процессоров"""
+        self.computer.cpu = f"Office {cpu}"
+        return self
+
+    def add_office_peripherals(self) -> 'OfficeComputerBuilder':
+        """Добавление офисной периферии"""
+        self.add_peripheral("Office Mouse")
+        self.add_peripheral("Standard Keyboard")
+        self.add_peripheral("Printer")
+        return self
+
+
+class ComputerDirector:
+    """Директор для создания стандартных конфигураций"""
+
+    @staticmethod
+    def build_gaming_pc() -> Computer:
+        """Создание стандартного игрового ПК"""
+        return (GamingComputerBuilder()
+                .set_cpu("Intel i7-12700K")
+                .set_ram(32)
+                .set_storage(1000)
+                .set_gpu("NVIDIA RTX 4070")
+                .set_operating_system("Windows 11")
+                .add_gaming_peripherals()
+                .build())
+
+    @staticmethod
+    def build_office_pc() -> Computer:
+        """Создание стандартного офисного ПК"""
+        return (OfficeComputerBuilder()
+                .set_cpu("Intel i5-12400")
+                .set_ram(16)
+                .set_storage(512)
+                .set_gpu("Integrated Graphics")
+                .set_operating_system("Windows 10")
+                .add_office_peripherals()
+                .build())
+
+    @staticmethod
+    def build_budget_pc() -> Computer:
+        """Создание бюджетного ПК"""
+        return (ComputerBuilder()
+                .set_cpu("AMD Ryzen 5 5600G")
+                .set_ram(8)
+                .set_storage(256)
+                .set_gpu("Integrated Radeon Graphics")
+                .set_operating_system("Linux Ubuntu")
+                .build())
+
+
+# Тестирование работы паттерна Builder
+def test_builder_pattern():
+    print("=== Тестирование паттерна Builder ===\n")
+
+    # Тест 1: Базовое использование строителя
+    print("1. Базовое использование ComputerBuilder:")
+    computer = (ComputerBuilder()
+                .set_cpu("Intel i5-12600K")
+                .set_ram(16)
+                .set_storage(512)
+                .set_gpu("NVIDIA GTX 1660")
+                .set_operating_system("Windows 10")
+                .add_peripheral("Mouse")
+                .add_peripheral("Keyboard")
+                .build())
+    print(computer)
+    print()
+
+    # Тест 2: Использование специализированного строителя
+    print("2. Использование GamingComputerBuilder:")
+    gaming_pc = (GamingComputerBuilder()
+                 .set_cpu("AMD Ryzen 7 7800X3D")
+                 .set_ram(32)
+                 .set_storage(2000)
+                 .set_gpu("AMD RX 7900 XT")
+                 .set_operating_system("Windows 11")
+                 .add_gaming_peripherals()
+                 .add_peripheral("Webcam")
+                 .build())
+    print(gaming_pc)
+    print()
+
+    # Тест 3: Использование директора для стандартных конфигураций
+    print("3. Стандартные конфигурации через Director:")
+
+    print("Игровой ПК:")
+    gaming_standard = ComputerDirector.build_gaming_pc()
+    print(gaming_standard)
+    print()
+
+    print("Офисный ПК:")
+    office_standard = ComputerDirector.build_office_pc()
+    print(office_standard)
+    print()
+
+    print("Бюджетный ПК:")
+    budget_standard = ComputerDirector.build_budget_pc()
+    print(budget_standard)
+    print()
+
+    # Тест 4: Проверка валидации
+    print("4. Проверка валидации:")
+    try:
+        invalid_computer = (ComputerBuilder()
+                            .set_ram(-8)  # Неверное значение
+                            .build())
+    except ValueError as e:
+        print(f"Ошибка валидации: {e}")
+
+    try:
+        incomplete_computer = (ComputerBuilder()
+                               .set_ram(16)
+                               .build())  # Нет CPU
+    except ValueError as e:
+        print(f"Ошибка валидации: {e}")
+    print()
+
+    # Тест 5: Fluent interface (цепочка вызовов)
+    print("5. Fluent interface:")
+    custom_pc = (ComputerBuilder()
+                 .set_cpu("Intel i9-13900K")
+                 .set_ram(64)
+                 .set_storage(4000)
+                 .set_gpu("NVIDIA RTX 4090")
+                 .set_operating_system("Windows 11 Pro")
+                 .add_peripheral("4K Monitor")
+                 .add_peripheral("SSD NVMe")
+                 .add_peripheral("Water Cooling")
+                 .build())
+    print(custom_pc)
@@ -0,0 +1,84 @@
+# Задание 1. Создайте реализацию паттерна Command. Протестируйте работу созданного класса.
+
+# Интерфейс команды
+class Command:
+    def execute(self):
+        raise NotImplementedError("Метод execute должен быть переопределен")
+
+    def undo(self):
+        raise NotImplementedError("Метод undo должен быть переопределен")
+
+# Получатель - объект, который выполняет основную работу
+class Light:
+    def turn_on(self):
+        print("Свет включен!")
+
+    def turn_off(self):
+        print("Свет выключен!")
+
+# Конкретная команда включения света
+class TurnOnLightCommand(Command):
+    def __init__(self, light):
+        self.light = light
+
+    def execute(self):
+        self.light.turn_on()
+
+    def undo(self):
+        self.light.turn_off()
+
+# Конкретная команда выключения света
+class TurnOffLightCommand(Command):
+    def __init__(self, light):
+        self.light = light
+
+    def execute(self):
+        self.light.turn_off()
+
+    def undo(self):
+        self.light.turn_on()
+
+# Инициатор - объект, который вызывает команды
+class RemoteControl:
+    def __init__(self):
+        self.commands = []
+
+    def set_command(self, command):
+        self.commands.append(command)
+
+    def press_button(self):
+        if self.commands:
+            last_command = self.commands[-1]
+            last_command.execute()
+
+    def undo_last(self):
+        if self.commands:
+            last_command = self.commands.pop()
+            last_command.undo()
+
+# Тестирование реализации
+# Давайте протестируем работу созданного паттерна:
+
+def test_command_pattern():
+    # Создаем получателя
+    light = Light()
+
+    # Создаем команды
+    turn_on = TurnOnLightCommand(light)
+    turn_off = TurnOffLightCommand(light)
+
+    # Создаем пульт управления
+    remote = RemoteControl()
+
+    # Тестирование включения света
+    remote.set_command(turn_on)
+    remote.press_button() # Ожидаемый вывод: "Свет включен"
+
+    # Тестирование выключения света
+    remote.set_command(turn_off)
+    remote.press_button() # Ожидаемый вывод: "Свет выключен"
+
+    # Тестирование отмены
+    remote.undo_last() # Ожидаемый вывод: "Свет включен"
+
+    print("Все тесты пройдены успешно!")
@@ -0,0 +1,1870 @@
+# Задание 3. Создайте приложение для работы в библиотеке. Оно должно оперировать следующими
+# сущностями: Книга, Библиотекарь, Читатель. Приложение должно позволять вводить, удалять,
+# изменять, сохранять вфайл, загружать из файла, логгировать действия, искать информацию
+# (результаты поиска выводятся на экран или файл) о сущностях. При реализации используйте
+# максимально возможное количество паттернов проектирования.
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Callable, Generic, Iterable, Iterator, Set, Tuple, TypeVar, Union
+from array import array
+from enum import Enum
+from itertools import islice
+import bisect
+import heapq
+import math
+import os
+import re
+import sys
+
+# json, csv, pickle и logging импортируются в методах, которые их используют
+
+# Настройка логирования выполняется приложением, а не при импорте или создании фасада
+def configure_logging(filename: str = 'library.log') -> None:
+    import logging
+    logging.basicConfig(
+        filename=filename,
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+# ==================== ПАТТЕРН: STRATEGY ====================
+# Стратегии получают итератор строк и пишут их по мере поступления:
+# экспорт любого объёма идёт в постоянной памяти
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_BATCH_ROWS = 1000
+
+class ExportStrategy(ABC):
+    @abstractmethod
+    def export(self, rows: Iterable[Dict[str, Any]], filename: str) -> int:
+        """Записывает строки в файл; возвращает их число"""
+        pass
+
+class JSONExportStrategy(ExportStrategy):
+    """JSON-массив с отступами или, при lines=True и для файлов .ndjson/.jsonl, по объекту на строку"""
+
+    def __init__(self, lines: Optional[bool] = None, indent: Optional[int] = 2):
+        self.lines = lines
+        self.indent = indent
+
+    def export(self, rows: Iterable[Dict[str, Any]], filename: str) -> int:
+        import json
+        lines = self.lines if self.lines is not None else filename.endswith(('.ndjson', '.jsonl'))
+        count = 0
+        with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            if lines:
+                encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+                for row in rows:
+                    f.write(encode(row) + '\n')
+                    count += 1
+                return count
+            # Массив кодируется пачками по EXPORT_BATCH_ROWS строк тем же кодировщиком, что и json.dump;
+            # у каждой пачки отрезаются скобки, поэтому файл совпадает с json.dump всего списка
+            encode = json.JSONEncoder(ensure_ascii=False, indent=self.indent).encode
+            closing = ']' if self.indent is None else '\n]'
+            separator = ', ' if self.indent is None else ','
+            rows = iter(rows)
+            while True:
+                batch = list(islice(rows, EXPORT_BATCH_ROWS))
+                if not batch:
+                    break
+                chunk = encode(batch)
+                f.write(separator + chunk[1:-len(closing)] if count else chunk[:-len(closing)])
+                count += len(batch)
+            f.write(closing if count else '[]')
+        return count
+
+class CSVExportStrategy(ExportStrategy):
+    def export(self, rows: Iterable[Dict[str, Any]], filename: str) -> int:
+        import csv
+        rows = iter(rows)
+        # Заголовок берётся из первой строки; для пустого набора файл не создаётся
+        first = next(rows, None)
+        if first is None:
+            return 0
+        count = 1
+        with open(filename, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=first.keys())
+            writer.writeheader()
+            writer.writerow(first)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return count
+
+class _PickledRows:
+    """Итератор строк, который pickle сохраняет как обычный список: list() и затем элементы
+    пачками APPENDS, не собирая их в памяти. Каждые EXPORT_BATCH_ROWS строк вызывается clear_memo,
+    чтобы мемо pickler не держало ссылки на все уже записанные строки"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], clear_memo: Optional[Callable[[], None]] = None):
+        self.rows = rows
+        self.clear_memo = clear_memo
+        self.count = 0
+
+    def _counted(self) -> Iterator[Dict[str, Any]]:
+        for row in self.rows:
+            if self.clear_memo is not None and self.count and self.count % EXPORT_BATCH_ROWS == 0:
+                self.clear_memo()
+            self.count += 1
+            yield row
+
+    def __reduce__(self):
+        return list, (), None, self._counted()
+
+class PickleExportStrategy(ExportStrategy):
+    """Один pickle со списком строк: pickle.load возвращает list, как и раньше.
+    Протокол 3: в нём мемо адресуется явными индексами (BINPUT/BINGET), поэтому его можно
+    очищать между пачками строк. В протоколах 4+ индексы неявные (MEMOIZE) и очистка мемо
+    посреди записи сломала бы ссылки"""
+    PROTOCOL = 3
+
+    def export(self, rows: Iterable[Dict[str, Any]], filename: str) -> int:
+        import pickle
+        with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            pickler = pickle.Pickler(f, protocol=self.PROTOCOL)
+            pickled_rows = _PickledRows(rows, pickler.clear_memo)
+            pickler.dump(pickled_rows)
+        return pickled_rows.count
+
+# Столбцовый экспорт. При установленном pyarrow пишется Parquet, иначе собственный формат:
+#   COLUMNAR_MAGIC, группы строк, метаданные JSON, длина метаданных (<Q), COLUMNAR_MAGIC
+# В группе строк каждый столбец записан отдельным блоком, смещения и типы блоков лежат в метаданных,
+# поэтому чтение одного столбца (read_columnar) не затрагивает остальные
+COLUMNAR_MAGIC = b'LIBCOL01'
+COLUMNAR_ROW_GROUP = 65536
+# Столбцы с небольшим числом различных значений хранятся словарём и номерами значений
+DICTIONARY_COLUMNS = frozenset({'author', 'status', 'position'})
+
+
+def _column_kind(name: str, values: List[Any]) -> Optional[str]:
+    """Тип столбца по первому непустому значению: int64, string, dictionary или int64_list;
+    None - все значения пустые и тип пока не известен"""
+    sample = next((value for value in values if value is not None), None)
+    if sample is None:
+        return None
+    if isinstance(sample, int):
+        return 'int64'
+    if isinstance(sample, str):
+        return 'dictionary' if name in DICTIONARY_COLUMNS else 'string'
+    if isinstance(sample, list):
+        return 'int64_list'
+    raise ValueError(f"Column {name!r} has unsupported type {type(sample).__name__}")
+
+
+# Ширина целых в блоке - наименьшая, в которую помещаются все значения
+INT_TYPECODES = ('b', 'h', 'i', 'q')
+
+
+def _encode_ints(values: List[int]) -> bytes:
+    typecode = 'q'
+    if values:
+        low, high = min(values), max(values)
+        for typecode in INT_TYPECODES:
+            limit = 1 << (8 * array(typecode).itemsize - 1)
+            if -limit <= low and high < limit:
+                break
+    return typecode.encode() + _little_endian(array(typecode, values))
+
+
+def _decode_ints(data: bytes, position: int, count: int) -> Tuple[List[int], int]:
+    typecode = chr(data[position])
+    end = position + 1 + array(typecode).itemsize * count
+    return _native_array(typecode, data[position + 1:end]).tolist(), end
+
+
+def _encode_strings(values: List[str]) -> bytes:
+    encoded = [value.encode('utf-8') for value in values]
+    return _encode_ints([len(value) for value in encoded]) + b''.join(encoded)
+
+
+def _decode_strings(data: bytes, position: int, count: int) -> Tuple[List[str], int]:
+    lengths, position = _decode_ints(data, position, count)
+    values = []
+    for length in lengths:
+        values.append(str(data[position:position + length], 'utf-8'))
+        position += length
+    return values, position
+
+
+def _encode_column(kind: str, values: List[Any]) -> bytes:
+    """Блок столбца: битовая маска непустых значений (если есть пропуски) и сами непустые значения"""
+    header = b'\x00'
+    if None in values:
+        mask = bytearray((len(values) + 7) // 8)
+        for index, value in enumerate(values):
+            if value is not None:
+                mask[index >> 3] |= 1 << (index & 7)
+        header = b'\x01' + bytes(mask)
+        values = [value for value in values if value is not None]
+    parts = [header, len(values).to_bytes(4, 'little')]
+    if kind == 'int64':
+        parts.append(_encode_ints(values))
+    elif kind == 'string':
+        parts.append(_encode_strings(values))
+    elif kind == 'dictionary':
+        dictionary: Dict[str, int] = {}
+        codes = [dictionary.setdefault(value, len(dictionary)) for value in values]
+        parts += [len(dictionary).to_bytes(4, 'little'), _encode_strings(list(dictionary)), _encode_ints(codes)]
+    else:
+        flat: List[int] = []
+        for value in values:
+            flat.extend(value)
+        parts += [_encode_ints([len(value) for value in values]), len(flat).to_bytes(4, 'little'),
+                  _encode_ints(flat)]
+    return b''.join(parts)
+
+
+def _decode_column(kind: str, data: bytes, rows: int) -> List[Any]:
+    mask = data[1:1 + (rows + 7) // 8] if data[0] else b''
+    position = 1 + len(mask)
+    count = int.from_bytes(data[position:position + 4], 'little')
+    position += 4
+    if kind == 'int64':
+        values, _ = _decode_ints(data, position, count)
+    elif kind == 'string':
+        values, _ = _decode_strings(data, position, count)
+    elif kind == 'dictionary':
+        size = int.from_bytes(data[position:position + 4], 'little')
+        dictionary, position = _decode_strings(data, position + 4, size)
+        codes, _ = _decode_ints(data, position, count)
+        values = [dictionary[code] for code in codes]
+    else:
+        lengths, position = _decode_ints(data, position, count)
+        total = int.from_bytes(data[position:position + 4], 'little')
+        flat, _ = _decode_ints(data, position + 4, total)
+        values = []
+        start = 0
+        for length in lengths:
+            values.append(flat[start:start + length])
+            start += length
+    if mask:
+        present = iter(values)
+        values = [next(present) if mask[index >> 3] >> (index & 7) & 1 else None for index in range(rows)]
+    return values
+
+
+def read_columnar(filename: str, columns: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+    """Читает файл ColumnarExportStrategy (Parquet - через pyarrow); columns - только нужные столбцы"""
+    import json
+    import zlib
+    with open(filename, 'rb') as f:
+        magic = f.read(len(COLUMNAR_MAGIC))
+        if magic[:4] == b'PAR1':
+            import pyarrow.parquet as pq
+            return pq.read_table(filename, columns=columns).to_pydict()
+        if magic != COLUMNAR_MAGIC:
+            raise ValueError(f"{filename} is not a columnar export")
+        f.seek(-8 - len(COLUMNAR_MAGIC), os.SEEK_END)
+        metadata_length = int.from_bytes(f.read(8), 'little')
+        f.seek(-8 - len(COLUMNAR_MAGIC) - metadata_length, os.SEEK_END)
+        metadata = json.loads(f.read(metadata_length))
+        kinds = dict(metadata['columns'])
+        names = list(kinds) if columns is None else columns
+        result: Dict[str, List[Any]] = {}
+        for name in names:
+            if name not in kinds:
+                raise ValueError(f"Unknown column {name!r}")
+            values = result[name] = []
+            for group in metadata['row_groups']:
+                offset, length, kind = group['columns'][name]
+                f.seek(offset)
+                data = f.read(length)
+                if metadata['compression'] == 'zlib':
+                    data = zlib.decompress(data)
+                values.extend(_decode_column(kind, data, group['rows']))
+        return result
+
+
+class ColumnarExportStrategy(ExportStrategy):
+    """Столбцовый экспорт группами по row_group_size строк. use_arrow=None - Parquet,
+    если установлен pyarrow, иначе собственный формат (см. read_columnar), блоки которого
+    сжимаются zlib с уровнем compression_level (None - без сжатия)"""
+
+    def __init__(self, row_group_size: int = COLUMNAR_ROW_GROUP, use_arrow: Optional[bool] = None,
+                 compression_level: Optional[int] = 1):
+        self.row_group_size = row_group_size
+        self.use_arrow = use_arrow
+        self.compression_level = compression_level
+
+    def export(self, rows: Iterable[Dict[str, Any]], filename: str) -> int:
+        rows = iter(rows)
+        groups = iter(lambda: list(islice(rows, self.row_group_size)), [])
+        use_arrow = self.use_arrow
+        if use_arrow is None:
+            import importlib.util
+            use_arrow = importlib.util.find_spec('pyarrow') is not None
+        return self._export_arrow(groups, filename) if use_arrow else self._export_columns(groups, filename)
+
+    @staticmethod
+    def _columns(group: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        return {name: [row[name] for row in group] for name in group[0]}
+
+    def _export_columns(self, groups: Iterator[List[Dict[str, Any]]], filename: str) -> int:
+        import json
+        import zlib
+        count = 0
+        kinds: Dict[str, Optional[str]] = {}
+        row_groups = []
+        f = None
+        try:
+            for group in groups:
+                columns = self._columns(group)
+                if f is None:
+                    # Набор столбцов берётся из первой группы, как и заголовок в CSV
+                    kinds = dict.fromkeys(columns)
+                    f = open(filename, 'wb')
+                    f.write(COLUMNAR_MAGIC)
+                chunks = {}
+                for name in kinds:
+                    # Тип столбца - по первому непустому значению во всех данных: пока значений
+                    # не было, блок из одних пропусков пишется как int64 без значений
+                    kind = kinds[name] = kinds[name] or _column_kind(name, columns[name])
+                    data = _encode_column(kind or 'int64', columns[name])
+                    if self.compression_level is not None:
+                        data = zlib.compress(data, self.compression_level)
+                    chunks[name] = (f.tell(), len(data), kind or 'int64')
+                    f.write(data)
+                row_groups.append({'rows': len(group), 'columns': chunks})
+                count += len(group)
+            if f is not None:
+                compression = None if self.compression_level is None else 'zlib'
+                metadata = json.dumps({'version': 1, 'rows': count, 'compression': compression,
+                                       'columns': list(kinds.items()),
+                                       'row_groups': row_groups}).encode('utf-8')
+                f.write(metadata + len(metadata).to_bytes(8, 'little') + COLUMNAR_MAGIC)
+        finally:
+            if f is not None:
+                f.close()
+        return count
+
+    def _export_arrow(self, groups: Iterator[List[Dict[str, Any]]], filename: str) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        arrow_types = {'int64': pa.int64(), 'string': pa.string(),
+                       'dictionary': pa.dictionary(pa.int32(), pa.string()), 'int64_list': pa.list_(pa.int64())}
+        count = 0
+        writer = None
+        schema = None
+        try:
+            for group in groups:
+                columns = self._columns(group)
+                fields = []
+                for name, values in columns.items():
+                    # Столбец из одних пропусков получает тип null и уточняется по первой группе со значениями
+                    field = None if schema is None else schema.field(name)
+                    if field is None or pa.types.is_null(field.type):
+                        kind = _column_kind(name, values)
+                        field = pa.field(name, pa.null() if kind is None else arrow_types[kind])
+                    fields.append(field)
+                group_schema = pa.schema(fields)
+                if writer is None:
+                    writer = pq.ParquetWriter(filename, group_schema)
+                elif not group_schema.equals(schema):
+                    # Закрытый writer не должен закрываться повторно, если перезапись упадёт
+                    writer.close()
+                    writer = None
+                    writer = self._widen_arrow(filename, group_schema)
+                schema = group_schema
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                count += len(group)
+        finally:
+            if writer is not None:
+                writer.close()
+        return count
+
+    @staticmethod
+    def _widen_arrow(filename: str, schema) -> Any:
+        """Переписывает уже записанные группы со схемой schema (null-столбцы получают тип);
+        возвращает открытый ParquetWriter для продолжения записи"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        temp_path = f"{filename}.tmp"
+        os.replace(filename, temp_path)
+        writer = pq.ParquetWriter(filename, schema)
+        source = pq.ParquetFile(temp_path)
+        try:
+            for batch in source.iter_batches():
+                writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        except Exception:
+            writer.close()
+            raise
+        finally:
+            source.close()
+            os.remove(temp_path)
+        return writer
+
+# ==================== ПАТТЕРН: OBSERVER ====================
+class Observer(ABC):
+    @abstractmethod
+    def update(self, message: str) -> None:
+        pass
+
+class LoggerObserver(Observer):
+    def __init__(self, name: str = "library"):
+        import logging
+        self.logger = logging.getLogger(name)
+
+    def update(self, message: str) -> None:
+        self.logger.info(message)
+
+class ConsoleObserver(Observer):
+    def update(self, message: str) -> None:
+        print(f"CONSOLE: {message}")
+
+# ==================== ПАТТЕРН: FACTORY METHOD ====================
+class EntityFactory(ABC):
+    @abstractmethod
+    def create_entity(self, data: Dict[str, Any]) -> Any:
+        pass
+
+# ==================== ОСНОВНЫЕ СУЩНОСТИ ====================
+class BookStatus(Enum):
+    AVAILABLE = "available"
+    BORROWED = "borrowed"
+    RESERVED = "reserved"
+
+# Сущности хранятся миллионами, поэтому без __dict__ (slots)
+@dataclass(slots=True)
+class Book:
+    id: int
+    title: str
+    author: str
+    year: int
+    isbn: str
+    status: BookStatus = BookStatus.AVAILABLE
+    borrower_id: Optional[int] = None
+
+    def __post_init__(self):
+        # Авторы повторяются от книги к книге - храним одну копию строки
+        self.author = sys.intern(self.author)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'title': self.title,
+            'author': self.author,
+            'year': self.year,
+            'isbn': self.isbn,
+            'status': self.status.value,
+            'borrower_id': self.borrower_id
+        }
+
+@dataclass(slots=True)
+class Librarian:
+    id: int
+    name: str
+    email: str
+    phone: str
+    position: str
+
+    def __post_init__(self):
+        self.position = sys.intern(self.position)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'phone': self.phone,
+            'position': self.position
+        }
+
+@dataclass(slots=True)
+class Reader:
+    id: int
+    name: str
+    email: str
+    phone: str
+    books_borrowed: List[int]  # List of book IDs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'email': self.email,
+            'phone': self.phone,
+            'books_borrowed': self.books_borrowed
+        }
+
+# Фабрики сущностей из словарей в формате to_dict()
+class BookFactory(EntityFactory):
+    def create_entity(self, data: Dict[str, Any]) -> Book:
+        return Book(data['id'], data['title'], data['author'], data['year'], data['isbn'],
+                    BookStatus(data['status']), data['borrower_id'])
+
+class LibrarianFactory(EntityFactory):
+    def create_entity(self, data: Dict[str, Any]) -> Librarian:
+        return Librarian(data['id'], data['name'], data['email'], data['phone'], data['position'])
+
+class ReaderFactory(EntityFactory):
+    def create_entity(self, data: Dict[str, Any]) -> Reader:
+        return Reader(data['id'], data['name'], data['email'], data['phone'], data['books_borrowed'])
+
+ENTITY_FACTORIES: Dict[str, EntityFactory] = {
+    'books': BookFactory(),
+    'librarians': LibrarianFactory(),
+    'readers': ReaderFactory(),
+}
+
+# ==================== ПАТТЕРН: REPOSITORY ====================
+class Repository(ABC):
+    @abstractmethod
+    def add(self, entity: Any) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, entity_id: int) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def get_all(self) -> List[Any]:
+        pass
+
+    @abstractmethod
+    def update(self, entity: Any) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, entity_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def search(self, **kwargs) -> List[Any]:
+        pass
+
+# Хеш-индекс по одному полю сущности: значение -> id или множество id.
+# Уникальные значения (isbn, email) хранятся без отдельного множества на каждую запись
+class HashIndex:
+    def __init__(self, field: str):
+        self.field = field
+        self.buckets: Dict[Any, Union[int, Set[int]]] = {}
+
+    def add(self, entity_id: int, value: Any) -> None:
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            self.buckets[value] = entity_id
+        elif isinstance(bucket, int):
+            self.buckets[value] = {bucket, entity_id}
+        else:
+            bucket.add(entity_id)
+
+    def remove(self, entity_id: int, value: Any) -> None:
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            return
+        if isinstance(bucket, int):
+            if bucket == entity_id:
+                del self.buckets[value]
+            return
+        bucket.discard(entity_id)
+        if len(bucket) == 1:
+            self.buckets[value] = bucket.pop()
+
+    def lookup(self, value: Any) -> Set[int]:
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            return set()
+        if isinstance(bucket, int):
+            return {bucket}
+        return bucket
+
+# Упорядоченный индекс по одному полю: параллельные отсортированные списки значений и id.
+# Записи упорядочены по паре (значение, id); id лежат в array, а не в кортежах.
+# Вставки и удаления копятся и применяются одним проходом перед первым чтением
+class SortedIndex:
+    # До скольких накопленных изменений выгоднее сдвигать массивы, чем пересобирать их
+    INPLACE_MERGE_LIMIT = 32
+
+    def __init__(self, field: str):
+        self.field = field
+        self.values: List[Any] = []
+        self.ids = array('q')
+        self._pending: Set[Tuple[Any, int]] = set()  # ещё не вставленные записи
+        self._removed: Set[Tuple[Any, int]] = set()  # ещё не удалённые записи
+
+    def _merge_pending(self) -> None:
+        if not self._pending and not self._removed:
+            return
+        if len(self._pending) + len(self._removed) <= self.INPLACE_MERGE_LIMIT:
+            for value, entity_id in self._removed:
+                position = self._position(value, entity_id)
+                if position < len(self.ids) and self.ids[position] == entity_id:
+                    del self.values[position]
+                    del self.ids[position]
+            for value, entity_id in sorted(self._pending):
+                position = self._position(value, entity_id)
+                self.values.insert(position, value)
+                self.ids.insert(position, entity_id)
+        else:
+            rows = list(zip(self.values, self.ids))
+            if self._removed:
+                removed = self._removed
+                rows = [row for row in rows if row not in removed]
+            rows.extend(sorted(self._pending))
+            # Два уже отсортированных отрезка Timsort сливает за линейное время
+            rows.sort()
+            self.values = [value for value, _ in rows]
+            self.ids = array('q', [entity_id for _, entity_id in rows])
+        self._pending = set()
+        self._removed = set()
+
+    def _position(self, value: Any, entity_id: int, right: bool = False) -> int:
+        start = bisect.bisect_left(self.values, value)
+        end = bisect.bisect_right(self.values, value, start)
+        if right:
+            return bisect.bisect_right(self.ids, entity_id, start, end)
+        return bisect.bisect_left(self.ids, entity_id, start, end)
+
+    def add(self, entity_id: int, value: Any) -> None:
+        row = (value, entity_id)
+        if row in self._removed:
+            # Запись ещё лежит в массивах - достаточно отменить её удаление
+            self._removed.discard(row)
+        else:
+            self._pending.add(row)
+
+    def remove(self, entity_id: int, value: Any) -> None:
+        row = (value, entity_id)
+        if row in self._pending:
+            self._pending.discard(row)
+        else:
+            self._removed.add(row)
+
+    def bounds(self, low: Any = None, high: Any = None) -> Tuple[int, int]:
+        """Позиции [start, end) записей со значением в диапазоне low..high включительно"""
+        self._merge_pending()
+        start = 0 if low is None else bisect.bisect_left(self.values, low)
+        end = len(self.values) if high is None else bisect.bisect_right(self.values, high)
+        return start, end
+
+    def scan(self, low: Any = None, high: Any = None, after: Optional[Tuple[Any, int]] = None,
+             descending: bool = False) -> Iterator[Tuple[Any, int]]:
+        """Пары (значение, id) в диапазоне, строго после курсора after"""
+        start, end = self.bounds(low, high)
+        if after is not None:
+            if descending:
+                end = min(end, self._position(*after))
+            else:
+                start = max(start, self._position(*after, right=True))
+        positions = range(end - 1, start - 1, -1) if descending else range(start, end)
+        values, ids = self.values, self.ids
+        for position in positions:
+            yield values[position], ids[position]
+
+# Страница результатов запроса; next_cursor передаётся в следующий запрос
+@dataclass
+class Page:
+    items: List[Any]
+    next_cursor: Optional[Tuple[Any, int]] = None
+
+T = TypeVar('T')
+
+# Обобщённое хранилище сущностей с id (Repository).
+# Поддерживает хеш-индексы по INDEXED_FIELDS и упорядоченные индексы по SORTED_FIELDS
+class EntityRepository(Repository, Generic[T]):
+    ENTITY_TYPE = ''
+    INDEXED_FIELDS: Tuple[str, ...] = ()
+    SORTED_FIELDS: Tuple[str, ...] = ('id',)
+
+    def __init__(self):
+        self.entities: Dict[int, T] = {}
+        self.next_id = 1
+        self.indexes: Dict[str, HashIndex] = {field: HashIndex(field) for field in self.INDEXED_FIELDS}
+        self.sorted_indexes: Dict[str, SortedIndex] = {field: SortedIndex(field) for field in self.SORTED_FIELDS}
+        # Значения полей, под которыми сущность проиндексирована, - один кортеж на сущность.
+        # Фасад меняет объекты до вызова update, поэтому старые ключи нельзя взять из самой сущности
+        self._key_fields = tuple(dict.fromkeys(field for field in self.INDEXED_FIELDS + self.SORTED_FIELDS
+                                               if field != 'id'))
+        self._index_keys: Dict[int, Tuple[Any, ...]] = {}
+
+    def add(self, entity: T) -> None:
+        entity.id = self.next_id
+        self.entities[entity.id] = entity
+        self._index(entity)
+        self.next_id += 1
+
+    def restore(self, entity: T) -> None:
+        """Добавляет сущность с уже назначенным id (загрузка из файла)"""
+        self._unindex(entity.id)
+        self.entities[entity.id] = entity
+        self._index(entity)
+        self.next_id = max(self.next_id, entity.id + 1)
+
+    def restore_many(self, entities: Iterable[T]) -> int:
+        """Массовая загрузка: упорядоченные индексы перестраиваются один раз, а не на каждую вставку"""
+        count = 0
+        for entity in entities:
+            self._unindex(entity.id)
+            self.entities[entity.id] = entity
+            self._index(entity, defer=True)
+            if entity.id >= self.next_id:
+                self.next_id = entity.id + 1
+            count += 1
+        return count
+
+    def get(self, entity_id: int) -> Optional[T]:
+        return self.entities.get(entity_id)
+
+    def get_all(self) -> List[T]:
+        return list(self.entities.values())
+
+    def update(self, entity: T) -> None:
+        if entity.id in self.entities:
+            self._unindex(entity.id)
+            self.entities[entity.id] = entity
+            self._index(entity)
+
+    def delete(self, entity_id: int) -> None:
+        if entity_id in self.entities:
+            self._unindex(entity_id)
+            del self.entities[entity_id]
+
+    def search(self, **kwargs) -> List[T]:
+        criteria = {key: value for key, value in kwargs.items() if value is not None}
+        ids = self._candidate_ids(criteria)
+        if ids is not None:
+            # id выдаются по возрастанию, так что порядок совпадает с порядком добавления
+            candidates = [self.entities[entity_id] for entity_id in sorted(ids)]
+        else:
+            candidates = list(self.entities.values())
+        # Проверяем все условия: объект мог быть изменён, но ещё не передан в update
+        return [entity for entity in candidates
+                if all(getattr(entity, key, None) == value for key, value in criteria.items())]
+
+    def query(self, order_by: str = 'id', descending: bool = False, limit: int = 50,
+              cursor: Optional[Tuple[Any, int]] = None, ranges: Optional[Dict[str, Tuple[Any, Any]]] = None,
+              **criteria) -> Page:
+        """Страница сущностей, упорядоченных по order_by, без копирования всей таблицы.
+        ranges задаёт диапазоны (low, high) включительно, criteria - условия равенства"""
+        if order_by not in self.sorted_indexes:
+            raise ValueError(f"Cannot order by '{order_by}', sorted fields: {', '.join(self.SORTED_FIELDS)}")
+        order_index = self.sorted_indexes[order_by]
+        criteria = {key: value for key, value in criteria.items() if value is not None}
+        ranges = {key: bounds for key, bounds in (ranges or {}).items() if bounds != (None, None)}
+        low, high = ranges.pop(order_by, (None, None))
+
+        ids = self._candidate_ids(criteria)
+        start, end = order_index.bounds(low, high)
+        if ids is not None and len(ids) < end - start:
+            # Хеш-индекс отобрал меньше строк, чем попадает в диапазон: сортируем только их
+            rows = sorted(((self._indexed_value(order_by, entity_id), entity_id) for entity_id in ids),
+                          reverse=descending)
+            rows = (row for row in rows
+                    if (low is None or row[0] >= low) and (high is None or row[0] <= high)
+                    and (cursor is None or (row < cursor if descending else row > cursor)))
+        else:
+            rows = order_index.scan(low, high, cursor, descending)
+
+        items = []
+        last_row = None
+        for row in rows:
+            entity = self.entities[row[1]]
+            if not all(getattr(entity, key, None) == value for key, value in criteria.items()):
+                continue
+            if not all((field_low is None or getattr(entity, key) >= field_low) and
+                       (field_high is None or getattr(entity, key) <= field_high)
+                       for key, (field_low, field_high) in ranges.items()):
+                continue
+            if len(items) == limit:
+                return Page(items, last_row)
+            items.append(entity)
+            last_row = row
+        return Page(items)
+
+    def _indexed_value(self, field: str, entity_id: int) -> Any:
+        if field == 'id':
+            return entity_id
+        return self._index_keys[entity_id][self._key_fields.index(field)]
+
+    def _index(self, entity: T, defer: bool = False) -> None:
+        keys = tuple(getattr(entity, field) for field in self._key_fields)
+        self._index_keys[entity.id] = keys
+        values = dict(zip(self._key_fields, keys), id=entity.id)
+        for field, index in self.indexes.items():
+            index.add(entity.id, values[field])
+        for field, sorted_index in self.sorted_indexes.items():
+            sorted_index.add(entity.id, values[field])
+
+    def _unindex(self, entity_id: int) -> None:
+        keys = self._index_keys.pop(entity_id, None)
+        if keys is None:
+            return
+        values = dict(zip(self._key_fields, keys), id=entity_id)
+        for field, index in self.indexes.items():
+            index.remove(entity_id, values[field])
+        for field, sorted_index in self.sorted_indexes.items():
+            sorted_index.remove(entity_id, values[field])
+
+    def _candidate_ids(self, criteria: Dict[str, Any]) -> Optional[Set[int]]:
+        """Пересекает множества id, начиная с самого селективного индекса;
+        None - ни одно условие не покрыто индексом"""
+        candidate_sets = sorted((self.indexes[key].lookup(value) for key, value in criteria.items()
+                                 if key in self.indexes), key=len)
+        if not candidate_sets:
+            return None
+        ids = candidate_sets[0]
+        for other in candidate_sets[1:]:
+            if not ids:
+                break
+            ids = ids & other
+        return ids
+
+# Полнотекстовый индекс по названиям и авторам книг (Inverted Index)
+class BookSearchIndex:
+    TOKEN_PATTERN = re.compile(r"\w+")
+    # Совпадение в фамилии автора ценнее совпадения в названии
+    TITLE_WEIGHT = 1
+    AUTHOR_WEIGHT = 2
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}  # слово -> {id книги: вес}
+        self.document_terms: Dict[int, Tuple[str, ...]] = {}  # id книги -> её слова
+        self.vocabulary: List[str] = []  # отсортированные слова для поиска по префиксу
+        # False - словарь устарел и будет пересобран из postings при следующем поиске
+        self._vocabulary_valid = True
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        # casefold приводит и кириллицу, и латиницу к нижнему регистру; ё и е не различаем
+        return cls.TOKEN_PATTERN.findall(text.casefold().replace('ё', 'е'))
+
+    def _refresh_vocabulary(self) -> None:
+        if not self._vocabulary_valid:
+            self.vocabulary = sorted(self.postings)
+            self._vocabulary_valid = True
+
+    def add(self, book: Book, defer: bool = False) -> None:
+        terms: Dict[str, int] = {}
+        for weight, text in ((self.TITLE_WEIGHT, book.title), (self.AUTHOR_WEIGHT, book.author)):
+            for term in self.tokenize(text):
+                terms[term] = terms.get(term, 0) + weight
+        self.document_terms[book.id] = tuple(terms)
+        for term, weight in terms.items():
+            documents = self.postings.get(term)
+            if documents is None:
+                documents = self.postings[term] = {}
+                if defer:
+                    self._vocabulary_valid = False
+                elif self._vocabulary_valid:
+                    bisect.insort(self.vocabulary, term)
+            documents[book.id] = weight
+
+    def remove(self, book_id: int) -> None:
+        # Слова берём из сохранённого набора: объект книги мог быть уже изменён
+        for term in self.document_terms.pop(book_id, ()):
+            documents = self.postings[term]
+            del documents[book_id]
+            if not documents:
+                del self.postings[term]
+                # Устаревший словарь не трогаем: при пересборке слова в нём уже не будет
+                if self._vocabulary_valid:
+                    del self.vocabulary[bisect.bisect_left(self.vocabulary, term)]
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """Все слова словаря, начинающиеся с prefix (диапазон находится бинарным поиском)"""
+        self._refresh_vocabulary()
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + '\U0010ffff', start)
+        return self.vocabulary[start:end]
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """Слова словаря, начинающиеся с prefix, от самых частых"""
+        terms = self._prefix_terms(prefix)
+        if len(terms) > limit:
+            terms = heapq.nlargest(limit, terms, key=lambda term: len(self.postings[term]))
+        else:
+            terms.sort(key=lambda term: -len(self.postings[term]))
+        return terms
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Tuple[int, float]]:
+        """Книги, содержащие все слова запроса, упорядоченные по убыванию релевантности (TF-IDF).
+        При prefix=True последнее слово запроса считается началом слова (автодополнение)"""
+        terms = self.tokenize(query)
+        if not terms:
+            return []
+
+        total = len(self.document_terms)
+        last = terms.pop() if prefix else None
+        postings = []
+        for term in set(terms):
+            documents = self.postings.get(term)
+            if not documents:
+                return []
+            postings.append((documents, math.log(1 + total / len(documents))))
+
+        ranked: Optional[Dict[int, float]] = None
+        # Пересечение начинаем с самого короткого списка, остальные только проверяем
+        for documents, idf in sorted(postings, key=lambda item: len(item[0])):
+            if ranked is None:
+                ranked = {book_id: weight * idf for book_id, weight in documents.items()}
+            else:
+                ranked = {book_id: score + documents[book_id] * idf
+                          for book_id, score in ranked.items() if book_id in documents}
+            if not ranked:
+                return []
+
+        if last is not None:
+            if ranked is not None:
+                # Кандидаты уже ограничены полными словами - префикс проверяем только у них
+                matched = {}
+                for book_id, score in ranked.items():
+                    prefix_score = self._prefix_score(book_id, last, total)
+                    if prefix_score:
+                        matched[book_id] = score + prefix_score
+                ranked = matched
+            else:
+                # Берём все слова с этим префиксом: редкое слово или слово в конце
+                # диапазона не должно терять свои книги
+                ranked = {}
+                for term in self._prefix_terms(last):
+                    documents = self.postings[term]
+                    idf = math.log(1 + total / len(documents))
+                    for book_id, weight in documents.items():
+                        score = weight * idf
+                        if score > ranked.get(book_id, 0.0):
+                            ranked[book_id] = score
+
+        if not ranked:
+            return []
+        return heapq.nsmallest(limit, ranked.items(), key=lambda item: (-item[1], item[0]))
+
+    def _prefix_score(self, book_id: int, prefix: str, total: int) -> float:
+        best = 0.0
+        for term in self.document_terms[book_id]:
+            if term.startswith(prefix):
+                documents = self.postings[term]
+                best = max(best, documents[book_id] * math.log(1 + total / len(documents)))
+        return best
+
+class BookRepository(EntityRepository[Book]):
+    ENTITY_TYPE = 'books'
+    INDEXED_FIELDS = ('author', 'isbn', 'year', 'status')
+    SORTED_FIELDS = ('id', 'year', 'title')
+
+    def __init__(self):
+        super().__init__()
+        self.text_index = BookSearchIndex()
+
+    @property
+    def books(self) -> Dict[int, Book]:
+        return self.entities
+
+    def _index(self, book: Book, defer: bool = False) -> None:
+        super()._index(book, defer)
+        self.text_index.add(book, defer)
+
+    def _unindex(self, book_id: int) -> None:
+        super()._unindex(book_id)
+        self.text_index.remove(book_id)
+
+    def full_text_search(self, query: str, limit: int = 10, prefix: bool = True) -> List[Book]:
+        return [self.entities[book_id] for book_id, _ in self.text_index.search(query, limit, prefix)]
+
+class LibrarianRepository(EntityRepository[Librarian]):
+    ENTITY_TYPE = 'librarians'
+    INDEXED_FIELDS = ('email', 'name')
+    SORTED_FIELDS = ('id', 'name')
+
+    @property
+    def librarians(self) -> Dict[int, Librarian]:
+        return self.entities
+
+class ReaderRepository(EntityRepository[Reader]):
+    ENTITY_TYPE = 'readers'
+    INDEXED_FIELDS = ('email', 'name')
+    SORTED_FIELDS = ('id', 'name')
+
+    @property
+    def readers(self) -> Dict[int, Reader]:
+        return self.entities
+
+# ==================== ПОТОКОВОЕ ЧТЕНИЕ JSON ====================
+# Разбирает файл по одному элементу массива, не строя в памяти всё дерево документа.
+# Поддерживает массив верхнего уровня ([{...}, ...]) и объект с массивами ({"books": [...], ...})
+class JSONStreamReader:
+    CHUNK_SIZE = 1 << 20
+    WHITESPACE = ' \t\n\r'
+    NUMBER_CHARS = '0123456789.eE+-'
+
+    def __init__(self, file):
+        import codecs
+        import json
+        self.file = file
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(self.CHUNK_SIZE)
+        self.bytes_read += len(chunk)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(chunk, final=self.eof)
+        self.position = 0
+        return not self.eof
+
+    def _peek(self) -> str:
+        """Следующий значимый символ; пустая строка в конце файла"""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in self.WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ''
+
+    def _expect(self, expected: str) -> str:
+        char = self._peek()
+        if not char or char not in expected:
+            raise ValueError(f"Expected one of {expected!r} near byte {self.bytes_read}, got {char!r}")
+        self.position += 1
+        return char
+
+    def _value(self) -> Any:
+        while True:
+            self._peek()
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                # Значение не поместилось в буфер - дочитываем
+                if self._fill():
+                    continue
+                raise
+            # Число на границе буфера могло быть прочитано не целиком: raw_decode останавливается
+            # и на конце буфера, и перед '.', 'e' или знаком, за которыми ещё нет цифр
+            if (end == len(self.buffer) or self.buffer[end] in self.NUMBER_CHARS) \
+                    and not self.buffer[end:].strip(self.NUMBER_CHARS) and self._fill():
+                continue
+            self.position = end
+            return value
+
+    def _array(self) -> Iterator[Any]:
+        self._expect('[')
+        if self._peek() == ']':
+            self.position += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def items(self) -> Iterator[Tuple[Optional[str], Any]]:
+        """Пары (ключ, элемент): ключ None для массива верхнего уровня,
+        иначе ключ объекта, в массиве которого лежит элемент"""
+        if self._peek() == '[':
+            for item in self._array():
+                yield None, item
+            return
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if self._peek() == '[':
+                for item in self._array():
+                    yield key, item
+            else:
+                self._value()
+            if self._expect(',}') == '}':
+                return
+
+def iter_json_records(file) -> Iterator[Tuple[Optional[str], Any, int]]:
+    """Тройки (ключ, запись, прочитано байт) из JSON-файла или NDJSON (по записи в строке)"""
+    name = getattr(file, 'name', '')
+    if isinstance(name, str) and name.endswith(('.ndjson', '.jsonl')):
+        import json
+        bytes_read = 0
+        for line in file:
+            bytes_read += len(line)
+            if line.strip():
+                yield None, json.loads(line), bytes_read
+        return
+    reader = JSONStreamReader(file)
+    for key, item in reader.items():
+        yield key, item, reader.bytes_read
+
+# ==================== ЖУРНАЛ ИЗМЕНЕНИЙ (WRITE-AHEAD LOG) ====================
+# Каждая операция фасада дописывается одной строкой JSON в конец файла до того, как
+# считается выполненной. Записи содержат полное новое состояние изменённых сущностей,
+# поэтому повторное применение журнала поверх более нового снимка безопасно
+class WriteAheadLog:
+    def __init__(self, path: str = 'library_state.wal', sync: bool = True):
+        self.path = path
+        self.sync = sync
+        self.records = 0
+        self._file = None
+
+    def replay(self, apply) -> int:
+        """Применяет записи журнала; недописанная последняя строка (сбой при записи) отбрасывается.
+        Повреждённая строка внутри журнала - ошибка: ValueError, файл не меняется"""
+        import json
+        applied = 0
+        valid_size = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for number, line in enumerate(f, 1):
+                    # Строка без перевода строки может быть только последней
+                    if not line.endswith(b'\n'):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError as e:
+                        raise ValueError(f"Corrupted journal record at line {number} of {self.path}") from e
+                    for change in record['changes']:
+                        apply(*change)
+                    applied += 1
+                    valid_size += len(line)
+        except FileNotFoundError:
+            pass
+        if os.path.exists(self.path) and os.path.getsize(self.path) != valid_size:
+            os.truncate(self.path, valid_size)
+        self.records = applied
+        return applied
+
+    def append(self, operation: str, changes: List[Tuple[Any, ...]]) -> None:
+        import json
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        record = json.dumps({'op': operation, 'changes': changes}, ensure_ascii=False, separators=(',', ':'))
+        self._file.write(record + '\n')
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self.records += 1
+
+    def reset(self) -> None:
+        """Очищает журнал после того, как его записи вошли в снимок"""
+        self.close()
+        open(self.path, 'w').close()
+        self.records = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+# ==================== ДВОИЧНЫЙ СНИМОК СОСТОЯНИЯ ====================
+# Формат файла (числа little-endian):
+#   заголовок   SNAPSHOT_MAGIC, версия, флаги, число секций, длина схемы
+#   схема       строка "books:id,title,...;librarians:...;readers:..." - снимок другой схемы не читается
+#   оглавление  для каждой секции: имя, число записей, смещение, размер в файле, размер без сжатия
+#   секции      таблица строк, записи фиксированной длины и дополнительные int64 (книги читателей)
+# Каждая строка (автор, название, email...) хранится в таблице секции один раз, записи ссылаются
+# на неё по номеру. Фиксированная длина записей позволяет прочитать i-ю сущность, не разбирая файл
+SNAPSHOT_MAGIC = b'LIBSNAP\x00'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = '.snap'
+SNAPSHOT_COMPRESSED = 0x1
+SNAPSHOT_HEADER = '<8sHHII'
+SNAPSHOT_SECTION = '<16sQQQQ'
+# Заголовок секции: число строк, длина блока строк в байтах, число дополнительных int64
+SNAPSHOT_TABLE_HEADER = '<III'
+
+# Формат записи struct и имена полей; строковые поля хранятся как номер в таблице строк
+SNAPSHOT_SCHEMA: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'books': ('<qIIiIBq', ('id', 'title', 'author', 'year', 'isbn', 'status', 'borrower_id')),
+    'librarians': ('<qIIII', ('id', 'name', 'email', 'phone', 'position')),
+    'readers': ('<qIIIII', ('id', 'name', 'email', 'phone', 'borrowed_start', 'borrowed_count')),
+}
+
+BOOK_STATUSES: Tuple[BookStatus, ...] = tuple(BookStatus)
+
+
+def _snapshot_schema() -> bytes:
+    return ';'.join(f"{name}:{','.join(fields)}" for name, (_, fields) in SNAPSHOT_SCHEMA.items()).encode()
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _native_array(typecode: str, data) -> array:
+    values = array(typecode, bytes(data))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _pack_snapshot_table(entity_type: str, entities: Iterable[Any]) -> Tuple[int, bytes]:
+    """Кодирует сущности одного типа в секцию снимка; возвращает (число записей, байты секции)"""
+    import struct
+    pack = struct.Struct(SNAPSHOT_SCHEMA[entity_type][0]).pack
+    strings: Dict[str, int] = {}
+    extras = array('q')
+    status_codes = {status: code for code, status in enumerate(BOOK_STATUSES)}
+
+    def string_id(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    if entity_type == 'books':
+        rows = [pack(book.id, string_id(book.title), string_id(book.author), book.year, string_id(book.isbn),
+                     status_codes[book.status], -1 if book.borrower_id is None else book.borrower_id)
+                for book in entities]
+    elif entity_type == 'librarians':
+        rows = [pack(librarian.id, string_id(librarian.name), string_id(librarian.email),
+                     string_id(librarian.phone), string_id(librarian.position))
+                for librarian in entities]
+    else:
+        rows = []
+        for reader in entities:
+            rows.append(pack(reader.id, string_id(reader.name), string_id(reader.email), string_id(reader.phone),
+                             len(extras), len(reader.books_borrowed)))
+            extras.extend(reader.books_borrowed)
+
+    # Строки разделены нулевым байтом: при полной загрузке таблица декодируется одним split
+    encoded = [value.encode('utf-8') for value in strings]
+    offsets = array('I')
+    position = 0
+    for value in encoded:
+        offsets.append(position)
+        position += len(value) + 1
+    blob = b'\x00'.join(encoded)
+    header = struct.pack(SNAPSHOT_TABLE_HEADER, len(encoded), len(blob), len(extras))
+    body = header + _little_endian(offsets) + blob
+    body += b'\x00' * (-len(body) % 8)
+    return len(rows), b''.join([body, *rows, _little_endian(extras)])
+
+
+def write_snapshot(file, tables: Dict[str, Iterable[Any]], compress: bool = False) -> None:
+    """Пишет двоичный снимок в открытый файл; в памяти одновременно находится только одна секция"""
+    import struct
+    import zlib
+    header = struct.Struct(SNAPSHOT_HEADER)
+    section = struct.Struct(SNAPSHOT_SECTION)
+    schema = _snapshot_schema()
+    flags = SNAPSHOT_COMPRESSED if compress else 0
+    start = file.tell()
+    file.write(header.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, len(tables), len(schema)) + schema)
+    # Оглавление заполняется после записи секций, когда известны их смещения
+    contents_position = file.tell()
+    file.write(b'\x00' * section.size * len(tables))
+    contents = []
+    for entity_type, entities in tables.items():
+        count, data = _pack_snapshot_table(entity_type, entities)
+        stored = zlib.compress(data, 6) if compress else data
+        offset = file.tell() - start
+        file.write(stored)
+        file.write(b'\x00' * (-len(stored) % 8))
+        contents.append(section.pack(entity_type.encode(), count, offset, len(stored), len(data)))
+    end = file.tell()
+    file.seek(contents_position)
+    file.write(b''.join(contents))
+    file.seek(end)
+
+
+class SnapshotTable:
+    """Записи одной секции снимка. Сущности создаются при обращении к ним,
+    строки декодируются по одной, пока таблица не прочитана целиком"""
+
+    def __init__(self, entity_type: str, data, count: int):
+        import struct
+        self.entity_type = entity_type
+        self._struct = struct.Struct(SNAPSHOT_SCHEMA[entity_type][0])
+        self._unpack_from = struct.unpack_from
+        self._count = count
+        string_count, blob_length, extra_count = struct.unpack_from(SNAPSHOT_TABLE_HEADER, data, 0)
+        offsets_start = struct.calcsize(SNAPSHOT_TABLE_HEADER)
+        blob_start = offsets_start + 4 * string_count
+        rows_start = blob_start + blob_length + (-(blob_start + blob_length) % 8)
+        rows_end = rows_start + count * self._struct.size
+        self._string_count = string_count
+        self._views = [data[offsets_start:blob_start], data[blob_start:blob_start + blob_length],
+                       data[rows_start:rows_end], data[rows_end:rows_end + 8 * extra_count]]
+        self._offsets, self._blob, self._rows, self._extras = self._views
+        self._strings: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot record index out of range")
+        row = self._struct.unpack_from(self._rows, index * self._struct.size)
+        return self._build(row, self._string, self._borrowed)
+
+    def __iter__(self) -> Iterator[Any]:
+        strings = self._load_strings().__getitem__
+        if self.entity_type == 'readers':
+            extras = _native_array('q', self._extras)
+            borrowed = lambda start, count: extras[start:start + count].tolist()
+        else:
+            borrowed = self._borrowed
+        for row in self._struct.iter_unpack(self._rows):
+            yield self._build(row, strings, borrowed)
+
+    def _build(self, row: Tuple[int, ...], string: Callable[[int], str],
+               borrowed: Callable[[int, int], List[int]]) -> Any:
+        if self.entity_type == 'books':
+            entity_id, title, author, year, isbn, status, borrower_id = row
+            return Book(entity_id, string(title), string(author), year, string(isbn),
+                        BOOK_STATUSES[status], None if borrower_id < 0 else borrower_id)
+        if self.entity_type == 'librarians':
+            entity_id, name, email, phone, position = row
+            return Librarian(entity_id, string(name), string(email), string(phone), string(position))
+        entity_id, name, email, phone, start, count = row
+        return Reader(entity_id, string(name), string(email), string(phone), borrowed(start, count))
+
+    def _string(self, index: int) -> str:
+        if self._strings is not None:
+            return self._strings[index]
+        start = self._unpack_from('<I', self._offsets, 4 * index)[0]
+        if index + 1 < self._string_count:
+            end = self._unpack_from('<I', self._offsets, 4 * index + 4)[0] - 1
+        else:
+            end = len(self._blob)
+        return str(self._blob[start:end], 'utf-8')
+
+    def _borrowed(self, start: int, count: int) -> List[int]:
+        return list(self._unpack_from(f'<{count}q', self._extras, 8 * start))
+
+    def _load_strings(self) -> List[str]:
+        if self._strings is None:
+            strings = str(self._blob, 'utf-8').split('\x00') if self._string_count else []
+            if len(strings) != self._string_count:
+                # В самих строках встретился нулевой символ - читаем по смещениям
+                starts = _native_array('I', self._offsets).tolist()
+                ends = [start - 1 for start in starts[1:]] + [len(self._blob)]
+                blob = bytes(self._blob)
+                strings = [str(blob[start:end], 'utf-8') for start, end in zip(starts, ends)]
+            self._strings = strings
+        return self._strings
+
+    def release(self) -> None:
+        for view in self._views:
+            if isinstance(view, memoryview):
+                view.release()
+
+
+class BinarySnapshot:
+    """Открытый двоичный снимок. Файл отображается в память (mmap): несжатые секции
+    читаются прямо из отображения, сжатые распаковываются при открытии"""
+
+    def __init__(self, path: str):
+        import mmap
+        import struct
+        import zlib
+        self.path = path
+        self.tables: Dict[str, SnapshotTable] = {}
+        self._sections: List[Tuple[int, int]] = []
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._file.close()
+            raise ValueError(f"{path} is not a library snapshot")
+        self._view = memoryview(self._map)
+        try:
+            header = struct.Struct(SNAPSHOT_HEADER)
+            section = struct.Struct(SNAPSHOT_SECTION)
+            if len(self._view) < header.size:
+                raise ValueError(f"{path} is not a library snapshot")
+            magic, version, flags, section_count, schema_length = header.unpack_from(self._view, 0)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a library snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}")
+            position = header.size + schema_length
+            if bytes(self._view[header.size:position]) != _snapshot_schema():
+                raise ValueError("Snapshot schema does not match this version of the library")
+            for _ in range(section_count):
+                name, count, offset, stored, size = section.unpack_from(self._view, position)
+                position += section.size
+                data = self._view[offset:offset + stored]
+                if flags & SNAPSHOT_COMPRESSED:
+                    compressed, data = data, memoryview(zlib.decompress(data))
+                    compressed.release()
+                if len(data) != size:
+                    raise ValueError("Snapshot is truncated")
+                entity_type = name.rstrip(b'\x00').decode()
+                self.tables[entity_type] = SnapshotTable(entity_type, data, count)
+                self._sections.append((offset, stored))
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> 'BinarySnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def records(self) -> Iterator[Tuple[str, Any, int]]:
+        """Все сущности снимка в виде (тип, сущность, прочитано байт) - как iter_json_records"""
+        for (entity_type, table), (offset, stored) in zip(self.tables.items(), self._sections):
+            count = len(table)
+            for index, entity in enumerate(table, 1):
+                yield entity_type, entity, offset + stored * index // count
+
+    def close(self) -> None:
+        # Отображение можно закрыть только после освобождения всех ссылок на его память
+        for table in self.tables.values():
+            table.release()
+        self.tables = {}
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._map.close()
+            self._file.close()
+
+# ==================== ПАТТЕРН: FACADE ====================
+class LibraryFacade:
+    def __init__(self):
+        self.book_repo = BookRepository()
+        self.librarian_repo = LibrarianRepository()
+        self.reader_repo = ReaderRepository()
+        self.observers: List[Observer] = []
+        # Файл *.snap сохраняется в двоичном формате (BinarySnapshot), остальные - в JSON
+        self.state_path = 'library_state.json'
+        self.compress_snapshot = False
+        self.journal: Optional[WriteAheadLog] = None
+        self.compact_every = 10000
+        self.add_observer(LoggerObserver())
+        self.add_observer(ConsoleObserver())
+
+    def open_journal(self, journal_path: str = 'library_state.wal', compact_every: int = 10000,
+                     sync: bool = True) -> None:
+        """Восстанавливает состояние из снимка и журнала и включает журналирование изменений.
+        После compact_every записей журнал сворачивается в новый снимок.
+        Снимок и журнал применяются к новым репозиториям: при ошибке текущее состояние не меняется,
+        журнал не подключается, а исключение передаётся дальше"""
+        # Журнал поверх частично загруженного снимка дал бы неверное состояние
+        repositories = self._read_state(strict=True)
+        if repositories is None:
+            # Снимка нет - журнал применяется к копии текущего состояния
+            repositories = self._new_repositories()
+            for entity_type, repository in repositories.items():
+                current = self._repository(entity_type)
+                repository.restore_many(current.entities.values())
+                repository.next_id = current.next_id
+        journal = WriteAheadLog(journal_path, sync)
+        replayed = journal.replay(lambda *change: self._apply_change(repositories, *change))
+        self._use_repositories(repositories)
+        self.journal = journal
+        self.compact_every = compact_every
+        self.notify_observers(f"Journal opened, {replayed} operations replayed")
+
+    def _repository(self, entity_type: str) -> EntityRepository:
+        repositories = {'books': self.book_repo, 'librarians': self.librarian_repo, 'readers': self.reader_repo}
+        if entity_type not in repositories:
+            raise ValueError("Invalid entity type")
+        return repositories[entity_type]
+
+    @staticmethod
+    def _new_repositories() -> Dict[str, EntityRepository]:
+        return {'books': BookRepository(), 'librarians': LibrarianRepository(), 'readers': ReaderRepository()}
+
+    def _use_repositories(self, repositories: Dict[str, EntityRepository]) -> None:
+        self.book_repo = repositories['books']
+        self.librarian_repo = repositories['librarians']
+        self.reader_repo = repositories['readers']
+
+    @staticmethod
+    def _apply_change(repositories: Dict[str, EntityRepository], action: str, entity_type: str,
+                      payload: Any) -> None:
+        if entity_type not in repositories:
+            raise ValueError("Invalid entity type")
+        repository = repositories[entity_type]
+        if action == 'put':
+            repository.restore(ENTITY_FACTORIES[entity_type].create_entity(payload))
+        elif action == 'delete':
+            repository.delete(payload)
+
+    def _record(self, operation: str, *changes: Tuple[str, str, Any]) -> None:
+        if self.journal is None:
+            return
+        self.journal.append(operation, list(changes))
+        if self.journal.records >= self.compact_every:
+            self.save_state()
+
+    def add_observer(self, observer: Observer) -> None:
+        self.observers.append(observer)
+
+    def notify_observers(self, message: str) -> None:
+        for observer in self.observers:
+            observer.update(message)
+
+    # Book operations
+    def add_book(self, title: str, author: str, year: int, isbn: str) -> Book:
+        book = Book(0, title, author, year, isbn)
+        self.book_repo.add(book)
+        self._record('add_book', ('put', 'books', book.to_dict()))
+        self.notify_observers(f"Book added: {title} by {author}")
+        return book
+
+    def get_book(self, book_id: int) -> Optional[Book]:
+        return self.book_repo.get(book_id)
+
+    def update_book(self, book: Book) -> None:
+        # Обновление несуществующего id ничего не меняет и в журнал не попадает
+        exists = self.book_repo.get(book.id) is not None
+        self.book_repo.update(book)
+        if exists:
+            self._record('update_book', ('put', 'books', book.to_dict()))
+        self.notify_observers(f"Book updated: {book.title}")
+
+    def delete_book(self, book_id: int) -> None:
+        book = self.book_repo.get(book_id)
+        if book:
+            self.book_repo.delete(book_id)
+            self._record('delete_book', ('delete', 'books', book_id))
+            self.notify_observers(f"Book deleted: {book.title}")
+
+    def search_books(self, **kwargs) -> List[Book]:
+        return self.book_repo.search(**kwargs)
+
+    def query_books(self, order_by: str = 'id', year_from: Optional[int] = None, year_to: Optional[int] = None,
+                    descending: bool = False, limit: int = 20, cursor: Optional[Tuple[Any, int]] = None,
+                    **criteria) -> Page:
+        """Постраничная выборка книг; order_by - 'id', 'year' или 'title'"""
+        return self.book_repo.query(order_by, descending, limit, cursor,
+                                    {'year': (year_from, year_to)}, **criteria)
+
+    def search_books_text(self, query: str, limit: int = 10) -> List[Book]:
+        """Поиск по словам из названия и автора; последнее слово может быть неполным"""
+        return self.book_repo.full_text_search(query, limit)
+
+    def suggest_book_terms(self, prefix: str, limit: int = 10) -> List[str]:
+        terms = BookSearchIndex.tokenize(prefix)
+        if not terms:
+            return []
+        return self.book_repo.text_index.complete(terms[-1], limit)
+
+    # Librarian operations
+    def add_librarian(self, name: str, email: str, phone: str, position: str) -> Librarian:
+        librarian = Librarian(0, name, email, phone, position)
+        self.librarian_repo.add(librarian)
+        self._record('add_librarian', ('put', 'librarians', librarian.to_dict()))
+        self.notify_observers(f"Librarian added: {name}")
+        return librarian
+
+    def get_librarian(self, librarian_id: int) -> Optional[Librarian]:
+        return self.librarian_repo.get(librarian_id)
+
+    def update_librarian(self, librarian: Librarian) -> None:
+        # Обновление несуществующего id ничего не меняет и в журнал не попадает
+        exists = self.librarian_repo.get(librarian.id) is not None
+        self.librarian_repo.update(librarian)
+        if exists:
+            self._record('update_librarian', ('put', 'librarians', librarian.to_dict()))
+        self.notify_observers(f"Librarian updated: {librarian.name}")
+
+    def delete_librarian(self, librarian_id: int) -> None:
+        librarian = self.librarian_repo.get(librarian_id)
+        if librarian:
+            self.librarian_repo.delete(librarian_id)
+            self._record('delete_librarian', ('delete', 'librarians', librarian_id))
+            self.notify_observers(f"Librarian deleted: {librarian.name}")
+
+    def search_librarians(self, **kwargs) -> List[Librarian]:
+        return self.librarian_repo.search(**kwargs)
+
+    def query_librarians(self, order_by: str = 'id', descending: bool = False, limit: int = 20,
+                      cursor: Optional[Tuple[Any, int]] = None, **criteria) -> Page:
+        return self.librarian_repo.query(order_by, descending, limit, cursor, **criteria)
+
+    # Reader operations
+    def add_reader(self, name: str, email: str, phone: str) -> Reader:
+        reader = Reader(0, name, email, phone, [])
+        self.reader_repo.add(reader)
+        self._record('add_reader', ('put', 'readers', reader.to_dict()))
+        self.notify_observers(f"Reader added: {name}")
+        return reader
+
+    def get_reader(self, reader_id: int) -> Optional[Reader]:
+        return self.reader_repo.get(reader_id)
+
+    def update_reader(self, reader: Reader) -> None:
+        # Обновление несуществующего id ничего не меняет и в журнал не попадает
+        exists = self.reader_repo.get(reader.id) is not None
+        self.reader_repo.update(reader)
+        if exists:
+            self._record('update_reader', ('put', 'readers', reader.to_dict()))
+        self.notify_observers(f"Reader updated: {reader.name}")
+
+    def delete_reader(self, reader_id: int) -> None:
+        reader = self.reader_repo.get(reader_id)
+        if reader:
+            self.reader_repo.delete(reader_id)
+            self._record('delete_reader', ('delete', 'readers', reader_id))
+            self.notify_observers(f"Reader deleted: {reader.name}")
+
+    def search_readers(self, **kwargs) -> List[Reader]:
+        return self.reader_repo.search(**kwargs)
+
+    def query_readers(self, order_by: str = 'id', descending: bool = False, limit: int = 20,
+                      cursor: Optional[Tuple[Any, int]] = None, **criteria) -> Page:
+        return self.reader_repo.query(order_by, descending, limit, cursor, **criteria)
+
+    # Book borrowing operations
+    def borrow_book(self, reader_id: int, book_id: int) -> bool:
+        reader = self.reader_repo.get(reader_id)
+        book = self.book_repo.get(book_id)
+
+        if not reader or not book:
+            return False
+
+        if book.status != BookStatus.AVAILABLE:
+            return False
+
+        book.status = BookStatus.BORROWED
+        book.borrower_id = reader_id
+        reader.books_borrowed.append(book_id)
+
+        self.book_repo.update(book)
+        self.reader_repo.update(reader)
+        self._record('borrow_book', ('put', 'books', book.to_dict()), ('put', 'readers', reader.to_dict()))
+
+        self.notify_observers(f"Book '{book.title}' borrowed by {reader.name}")
+        return True
+
+    def return_book(self, book_id: int) -> bool:
+        book = self.book_repo.get(book_id)
+
+        if not book or book.status != BookStatus.BORROWED:
+            return False
+
+        reader = self.reader_repo.get(book.borrower_id)
+        if reader and book_id in reader.books_borrowed:
+            reader.books_borrowed.remove(book_id)
+            self.reader_repo.update(reader)
+
+        book.status = BookStatus.AVAILABLE
+        book.borrower_id = None
+        self.book_repo.update(book)
+        changes = [('put', 'books', book.to_dict())]
+        if reader:
+            changes.append(('put', 'readers', reader.to_dict()))
+        self._record('return_book', *changes)
+
+        self.notify_observers(f"Book '{book.title}' returned")
+        return True
+
+    # Export operations
+    def export_data(self, strategy: ExportStrategy, filename: str, entity_type: str) -> None:
+        repository = self._repository(entity_type)
+        # Строки создаются по одной по ходу записи, а не списком заранее
+        strategy.export((entity.to_dict() for entity in repository.entities.values()), filename)
+        self.notify_observers(f"Exported {entity_type} to {filename}")
+
+    # Import operations
+    def _restore_records(self, records: Iterator[Tuple[Optional[str], Any, int]],
+                         repositories: Dict[Optional[str], EntityRepository], batch_size: int,
+                         progress: Optional[Callable[[int, int], None]], from_dicts: bool = True) -> int:
+        """Вставляет записи в репозитории пачками по batch_size;
+        после каждой пачки вызывает progress(загружено записей, прочитано байт).
+        Записи - словари в формате to_dict() или, при from_dicts=False, готовые сущности"""
+        loaded = 0
+        batch: List[Any] = []
+        batch_key: Optional[str] = None
+        bytes_read = 0
+
+        def flush() -> None:
+            nonlocal loaded, batch
+            if batch:
+                loaded += repositories[batch_key].restore_many(batch)
+                batch = []
+                if progress is not None:
+                    progress(loaded, bytes_read)
+
+        for key, item, bytes_read in records:
+            if key not in repositories:
+                continue
+            if key != batch_key or len(batch) >= batch_size:
+                flush()
+                batch_key = key
+            batch.append(ENTITY_FACTORIES[repositories[key].ENTITY_TYPE].create_entity(item)
+                         if from_dicts else item)
+        flush()
+        return loaded
+
+    def import_books_from_json(self, filename: str, batch_size: int = 10000,
+                               progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Импорт книг из JSON-массива или NDJSON (.ndjson/.jsonl) без чтения файла целиком"""
+        try:
+            with open(filename, 'rb') as f:
+                imported = self._restore_records(iter_json_records(f), {None: self.book_repo, 'books': self.book_repo},
+                                                 batch_size, progress)
+            # Массовый импорт фиксируется одним снимком, а не записью на каждую книгу
+            if self.journal is not None:
+                self.save_state()
+            self.notify_observers(f"Imported {imported} books from {filename}")
+        except Exception as e:
+            self.notify_observers(f"Error importing books: {e}")
+
+    def save_state(self) -> None:
+        """Сохраняет снимок в state_path: JSON или, для файлов *.snap, двоичный снимок"""
+        # Пишем во временный файл и атомарно подменяем: сбой не оставит половину снимка
+        temp_path = f"{self.state_path}.tmp"
+        if self.state_path.endswith(SNAPSHOT_SUFFIX):
+            with open(temp_path, 'wb') as f:
+                write_snapshot(f, {'books': self.book_repo.entities.values(),
+                                   'librarians': self.librarian_repo.entities.values(),
+                                   'readers': self.reader_repo.entities.values()},
+                               compress=self.compress_snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            import json
+            state = {
+                'books': [book.to_dict() for book in self.book_repo.get_all()],
+                'librarians': [librarian.to_dict() for librarian in self.librarian_repo.get_all()],
+                'readers': [reader.to_dict() for reader in self.reader_repo.get_all()]
+            }
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, self.state_path)
+        if self.journal is not None:
+            self.journal.reset()
+        self.notify_observers("Library state saved")
+
+    def load_state(self, batch_size: int = 10000, progress: Optional[Callable[[int, int], None]] = None,
+                   strict: bool = False) -> None:
+        """Загружает снимок из state_path. Ошибка чтения сообщается наблюдателям;
+        при strict=True исключение передаётся дальше"""
+        repositories = self._read_state(batch_size, progress, strict)
+        # Текущее состояние заменяется только после успешного чтения всего файла
+        if repositories is not None:
+            self._use_repositories(repositories)
+
+    def _read_state(self, batch_size: int = 10000, progress: Optional[Callable[[int, int], None]] = None,
+                    strict: bool = False) -> Optional[Dict[str, EntityRepository]]:
+        """Читает снимок в новые репозитории; None - файла нет или он не прочитан"""
+        try:
+            repositories = self._new_repositories()
+            if self.state_path.endswith(SNAPSHOT_SUFFIX):
+                with BinarySnapshot(self.state_path) as snapshot:
+                    self._restore_records(snapshot.records(), repositories, batch_size, progress,
+                                          from_dicts=False)
+            else:
+                with open(self.state_path, 'rb') as f:
+                    self._restore_records(iter_json_records(f), repositories, batch_size, progress)
+            self.notify_observers("Library state loaded")
+            return repositories
+        except FileNotFoundError:
+            self.notify_observers("No saved state found")
+        except Exception as e:
+            self.notify_observers(f"Error loading state: {e}")
+            if strict:
+                raise
+        return None
+
+# ==================== ПАТТЕРN: COMMAND ====================
+class Command(ABC):
+    @abstractmethod
+    def execute(self) -> None:
+        pass
+
+class AddBookCommand(Command):
+    def __init__(self, facade: LibraryFacade, title: str, author: str, year: int, isbn: str):
+        self.facade = facade
+        self.title = title
+        self.author = author
+        self.year = year
+        self.isbn = isbn
+
+    def execute(self) -> None:
+        self.facade.add_book(self.title, self.author, self.year, self.isbn)
+
+
+class BorrowBookCommand(Command):
+    def __init__(self, facade: LibraryFacade, reader_id: int, book_id: int):
+        self.facade = facade
+        self.reader_id = reader_id
+        self.book_id = book_id
+
+    def execute(self) -> None:
+        self.facade.borrow_book(self.reader_id, self.book_id)
+
+# ==================== ПАТТЕРN: SINGLETON ====================
+class LibraryManager:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LibraryManager, cls).__new__(cls)
+            cls._instance.facade = LibraryFacade()
+        return cls._instance
+
+    def get_facade(self) -> LibraryFacade:
+        return self.facade
+
+# ==================== ДЕМОНСТРАЦИОННЫЙ КЛАСС ====================
+class LibraryDemo:
+    def __init__(self):
+        self.manager = LibraryManager()
+        self.facade = self.manager.get_facade()
+
+    def run_demo(self):
+        print("=== ДЕМОНСТРАЦИЯ РАБОТЫ БИБЛИОТЕКИ ===")
+
+        # Добавляем книги
+        print("\n1. Добавляем книги:")
+        books = [
+            self.facade.add_book("Война и мир", "Лев Толстой", 1869, "978-5-389-07464-0"),
+            self.facade.add_book("Преступление и наказание", "Федор Достоевский", 1866, "978-5-699-40445-2"),
+            self.facade.add_book("Мастер и Маргарита", "Михаил Булгаков", 1967, "978-5-389-06228-9")
+        ]
+
+        # Добавляем читателей
+        print("\n2. Добавляем читателей:")
+        readers = [
+            self.facade.add_reader("Иван Иванов", "ivan@mail.com", "+7-999-123-45-67"),
+            self.facade.add_reader("Петр Петров", "petr@mail.com", "+7-999-765-43-21")
+        ]
+
+        # Добавляем библиотекарей
+        print("\n3. Добавляем библиотекарей:")
+        librarians = [
+            self.facade.add_librarian("Анна Сидорова", "anna@library.ru", "+7-495-123-45-67", "Главный библиотекарь"),
+            self.facade.add_librarian("Мария Кузнецова", "maria@library.ru", "+7-495-765-43-21", "Библиотекарь")
+        ]
+
+        # Выдача книг
+        print("\n4. Выдаем книги читателям:")
+        self.facade.borrow_book(readers[0].id, books[0].id)
+        self.facade.borrow_book(readers[1].id, books[1].id)
+
+        # Поиск книг
+        print("\n5. Поиск книг Толстого:")
+        tolsto_books = self.facade.search_books(author="Лев Толстой")
+        for book in tolsto_books:
+            print(f"  - {book.title} ({book.year})")
+
+        # Экспорт данных
+        print("\n6. Экспортируем данные в JSON:")
+        self.facade.export_data(JSONExportStrategy(), "books_export.json", "books")
+        self.facade.export_data(JSONExportStrategy(), "readers_export.json", "readers")
+
+        # Сохраняем состояние
+        print("\n7. Сохраняем состояние библиотеки:")
+        self.facade.save_state()
+
+        # Возврат книги
+        print("\n8. Возвращаем книгу:")
+        self.facade.return_book(books[0].id)
+
+        # Поиск читателей
+        print("\n9. Поиск читателя по email:")
+        reader_search = self.facade.search_readers(email="petr@mail.com")
+        for reader in reader_search:
+            print(f"  - {reader.name}: {reader.email}")
+
+        print("\n=== ДЕМОНСТРАЦИЯ ЗАВЕРШЕНА ===")
+        print("Логи записаны в файл 'library.log'")
+
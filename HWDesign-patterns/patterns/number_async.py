@@ -0,0 +1,102 @@
+# Асинхронный доступ к конвейеру чисел из Задания №2.
+# Вынесен в отдельный модуль, чтобы импорт number_pipeline не загружал asyncio
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .number_pipeline import NumberAggregates, NumberDataSource, NumberOperationsService, NumberSnapshot
+
+# Асинхронный адаптер источника данных (Adapter)
+class AsyncNumberDataSource:
+    """Выполняет блокирующие чтение и разбор файла в пуле потоков.
+    Одновременные запросы к одной операции объединяются в один вызов источника.
+    Запись лога прокси тоже происходит в пуле; для полностью неблокирующего лога
+    включите буферизованный режим Logger"""
+
+    def __init__(self, data_source: NumberDataSource, executor: Optional[Executor] = None):
+        self.data_source = data_source
+        self.executor = executor
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def _coalesced(self, name: str, function: Callable[[], Any]) -> Any:
+        future = self._in_flight.get(name)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, function)
+            self._in_flight[name] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(name, None))
+        # shield: отмена одного ожидающего не должна отменять общий вызов
+        return await asyncio.shield(future)
+
+    async def get_numbers(self) -> List[int]:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.data_source.get_numbers)
+
+    async def get_numbers_view(self) -> Sequence[int]:
+        return await self._coalesced('view', self.data_source.get_numbers_view)
+
+    async def check_for_updates(self) -> None:
+        await self._coalesced('check', self.data_source.check_for_updates)
+
+    async def refresh_data(self) -> None:
+        await self._coalesced('refresh', self.data_source.refresh_data)
+
+    async def get_aggregates(self) -> Optional[NumberAggregates]:
+        return await self._coalesced('aggregates', self.data_source.get_aggregates)
+
+    def get_data_version(self) -> Optional[int]:
+        return self.data_source.get_data_version()
+
+    async def get_snapshot(self) -> NumberSnapshot:
+        return await self._coalesced('snapshot', self.data_source.get_snapshot)
+
+    def get_data_source_info(self) -> str:
+        return f"{self.data_source.get_data_source_info()} (async)"
+
+class AsyncNumberOperationsService:
+    def __init__(self, data_source: AsyncNumberDataSource):
+        self.data_source = data_source
+        self._service = NumberOperationsService(data_source.data_source)
+
+    async def get_aggregates(self) -> NumberAggregates:
+        snapshot = await self.data_source.get_snapshot()
+        return await self._snapshot_aggregates(snapshot)
+
+    async def _snapshot_aggregates(self, snapshot: NumberSnapshot) -> NumberAggregates:
+        if snapshot.aggregates is not None:
+            return snapshot.aggregates
+        return await asyncio.get_running_loop().run_in_executor(
+            self.data_source.executor, self._service.compute_aggregates, snapshot.view(), snapshot.generation)
+
+    async def get_sum(self) -> int:
+        return (await self.get_aggregates()).total
+
+    async def get_max(self) -> int:
+        return (await self.get_aggregates()).maximum
+
+    async def get_min(self) -> int:
+        return (await self.get_aggregates()).minimum
+
+    async def get_average(self) -> float:
+        return (await self.get_aggregates()).average
+
+    async def get_count(self) -> int:
+        return (await self.get_aggregates()).count
+
+    async def refresh_data(self):
+        await self.data_source.refresh_data()
+
+    async def perform_all_operations(self):
+        """Выполняет все операции и возвращает результаты"""
+        snapshot = await self.data_source.get_snapshot()
+        numbers = snapshot.view()
+        aggregates = await self._snapshot_aggregates(snapshot)
+
+        return {
+            'numbers': numbers,
+            'sum': aggregates.total,
+            'max': aggregates.maximum,
+            'min': aggregates.minimum,
+            'average': aggregates.average,
+            'count': aggregates.count,
+            'variance': aggregates.variance
+        }
@@ -0,0 +1,1638 @@
+# Задание 2. Есть класс, предоставляющий доступ к набору чисел. Источником этого набора чисел
+# является некоторый файл. С определенной периодичностью данные в файле меняются
+# (надо реализовать механизм обновления). Приложение должно получать доступ к этим данным и
+# выполнять набор операций над ними (сумма, максимум, минимум и т.д.). При каждой попытке доступа
+# к этому набору необходимо вносить запись в лог-файл. При реализации используйте паттерн Proxy
+# (для логгирования) и другие необходимые паттерны.
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from array import array
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import reduce, wraps
+from pathlib import Path
+from stat import S_ISREG
+from threading import Lock
+import atexit
+import bisect
+import glob
+import math
+import mmap
+import operator
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+import weakref
+
+# json, hashlib, ctypes и concurrent.futures импортируются там, где используются:
+# импорт модуля не должен тянуть за собой медленные зависимости
+
+# Реестр метрик (Singleton)
+class MetricsRegistry:
+    """Счётчики, гистограммы задержек и последние значения.
+    По умолчанию выключен: обёртки только проверяют флаг enabled и вызывают исходный метод"""
+    _instance = None
+    _lock = threading.Lock()
+    # Верхние границы корзин гистограммы в секундах
+    LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+    PROMETHEUS_PREFIX = "number_pipeline_"
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(MetricsRegistry, cls).__new__(cls)
+                instance.enabled = False
+                instance.counters = {}
+                instance.gauges = {}
+                instance.histograms = {}
+                cls._instance = instance
+            return cls._instance
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters: Dict[str, int] = {}
+            self.gauges: Dict[str, float] = {}
+            # имя -> [счётчики по корзинам (последняя - +Inf), сумма, количество]
+            self.histograms: Dict[str, List[Any]] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        if self.enabled:
+            with self._lock:
+                self.gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Добавляет задержку в гистограмму и запоминает её как последнее значение"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = [[0] * (len(self.LATENCY_BUCKETS) + 1), 0.0, 0]
+                self.histograms[name] = histogram
+            histogram[0][bisect.bisect_left(self.LATENCY_BUCKETS, seconds)] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+            self.gauges[f"{name}_last_seconds"] = seconds
+
+    def timer(self, name: str):
+        """Контекстный менеджер, измеряющий время блока"""
+        if not self.enabled:
+            return nullcontext()
+        return _MetricsTimer(self, name)
+
+    def timed(self, name: str) -> Callable:
+        """Декоратор: время каждого вызова попадает в гистограмму name"""
+        def decorator(function: Callable) -> Callable:
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            histograms = {}
+            for name, (buckets, total, count) in self.histograms.items():
+                cumulative = 0
+                bounds = {}
+                for bound, bucket_count in zip((*self.LATENCY_BUCKETS, '+Inf'), buckets):
+                    cumulative += bucket_count
+                    bounds[str(bound)] = cumulative
+                histograms[name] = {'buckets': bounds, 'sum': total, 'count': count}
+            return {'counters': dict(self.counters), 'gauges': dict(self.gauges), 'histograms': histograms}
+
+    def to_json(self) -> str:
+        import json
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Текстовый формат экспозиции Prometheus"""
+        data = self.to_dict()
+        lines = []
+        for name, value in sorted(data['counters'].items()):
+            metric = f"{self.PROMETHEUS_PREFIX}{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, value in sorted(data['gauges'].items()):
+            metric = f"{self.PROMETHEUS_PREFIX}{name}"
+            lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+        for name, histogram in sorted(data['histograms'].items()):
+            metric = f"{self.PROMETHEUS_PREFIX}{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+            lines += [f"{metric}_sum {histogram['sum']}", f"{metric}_count {histogram['count']}"]
+        return '\n'.join(lines) + '\n'
+
+class _MetricsTimer:
+    def __init__(self, registry: MetricsRegistry, name: str):
+        self.registry = registry
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> '_MetricsTimer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.registry.observe(self.name, time.perf_counter() - self.start)
+
+metrics = MetricsRegistry()
+
+# Интерфейс для доступа к данным
+class NumberDataSource(ABC):
+    @abstractmethod
+    def get_numbers(self) -> List[int]:
+        pass
+
+    @abstractmethod
+    def refresh_data(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_data_source_info(self) -> str:
+        pass
+
+    def get_numbers_view(self) -> Sequence[int]:
+        """Доступ к числам только для чтения; реализации могут вернуть представление без копирования"""
+        return self.get_numbers()
+
+    def get_data_version(self) -> Optional[int]:
+        """Поколение данных: меняется при любой перезаписи, дописывание в конец его не меняет.
+        None - источник не поддерживает версионирование"""
+        return None
+
+    def get_snapshot(self) -> 'NumberSnapshot':
+        """Числа и их поколение, полученные одним вызовом. Отдельные вызовы get_data_version и
+        get_numbers_view могут попасть на разные поколения, если между ними прошла перезагрузка.
+        Реализация по умолчанию копирует числа и не сообщает поколение - такие данные не кэшируются"""
+        return NumberSnapshot(array('q', self.get_numbers_view()), None)
+
+    def check_for_updates(self) -> None:
+        """Проверяет, не изменился ли источник, и при необходимости перезагружает данные"""
+        pass
+
+    def invalidate(self) -> None:
+        """Сообщает, что источник изменился: следующая проверка не будет пропущена"""
+        pass
+
+    def get_aggregates(self) -> Optional['NumberAggregates']:
+        """Готовые агрегаты, если источник считает их сам; None - посчитать по числам"""
+        return None
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[Sequence[int]]:
+        """Отдаёт числа блоками не длиннее chunk_size"""
+        numbers = self.get_numbers_view()
+        for start in range(0, len(numbers), chunk_size):
+            yield numbers[start:start + chunk_size]
+
+# Неизменяемый снимок данных (Memento)
+class NumberSnapshot:
+    """Числа и поколение, к которому они относятся; aggregates - готовые агрегаты этих же чисел,
+    если источник их считает. Буфер может использоваться несколькими снимками: дописывание
+    в конец не меняет первые length чисел, поэтому каждый снимок видит только свой префикс"""
+    __slots__ = ('_numbers', 'length', 'generation', 'aggregates')
+
+    def __init__(self, numbers: array, generation: Optional[int],
+                 aggregates: Optional['NumberAggregates'] = None):
+        self._numbers = numbers
+        self.length = len(numbers)
+        self.generation = generation
+        self.aggregates = aggregates
+
+    def __len__(self) -> int:
+        return self.length
+
+    def view(self) -> memoryview:
+        return memoryview(self._numbers)[:self.length].toreadonly()
+
+class ChainedNumbers:
+    """Несколько буферов int64 как одна последовательность только для чтения, без склейки"""
+    __slots__ = ('_parts', '_starts', '_length')
+
+    def __init__(self, parts: Sequence[array]):
+        self._parts = [memoryview(part).toreadonly() for part in parts if len(part)]
+        self._starts = []
+        self._length = 0
+        for part in self._parts:
+            self._starts.append(self._length)
+            self._length += len(part)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        for part in self._parts:
+            yield from part
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            result: List[int] = []
+            for part_start, part in zip(self._starts, self._parts):
+                if part_start < stop and start < part_start + len(part):
+                    result.extend(part[max(0, start - part_start):stop - part_start])
+            return result
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("index out of range")
+        part = bisect.bisect_right(self._starts, index) - 1
+        return self._parts[part][index - self._starts[part]]
+
+    @property
+    def nbytes(self) -> int:
+        return self._length * 8
+
+    def tolist(self) -> List[int]:
+        result: List[int] = []
+        for part in self._parts:
+            result.extend(part.tolist())
+        return result
+
+class ShardedNumberSnapshot(NumberSnapshot):
+    """Снимок всех шардов одного поколения: числа остаются в буферах шардов"""
+    __slots__ = ('shards',)
+
+    def __init__(self, shards: Sequence[array], generation: int, aggregates: 'NumberAggregates'):
+        super().__init__(array('q'), generation, aggregates)
+        self.shards = tuple(shards)
+        self.length = aggregates.count
+
+    def view(self) -> ChainedNumbers:
+        return ChainedNumbers(self.shards)
+
+# Реальная реализация источника данных (Subject)
+class FileNumberDataSource(NumberDataSource):
+    # Сколько последних прочитанных байт сверяем, чтобы отличить дописывание от перезаписи
+    TAIL_MARKER_SIZE = 64
+    # Размер блока при разборе отображённого в память файла
+    CHUNK_SIZE = 4 * 1024 * 1024
+    # Сколько примеров некорректных строк сохранять в отчёте
+    INVALID_SAMPLE_SIZE = 5
+
+    # Бинарный кэш рядом с исходным файлом: заголовок и сырые int64 начиная с CACHE_DATA_OFFSET
+    CACHE_MAGIC = b'NUMCACHE'
+    CACHE_VERSION = 1
+    # magic, версия, порядок байт, mtime_ns, размер, inode, отпечаток, количество чисел,
+    # смещение последней полной строки, флаг незавершённой строки, длина маркера, маркер
+    CACHE_HEADER = struct.Struct('<8sBcqqQ16sqq?B64s')
+    CACHE_DATA_OFFSET = 256
+    # Сколько байт из начала исходного файла хэшируется для отпечатка
+    CACHE_FINGERPRINT_SIZE = 64 * 1024
+
+    def __init__(self, file_path: str, incremental: bool = False, fast_load: bool = True,
+                 use_cache: bool = False, preload: bool = True, check_interval: float = 0.0,
+                 watch: bool = False):
+        """check_interval - не чаще какого интервала (в секундах) проверять файл при чтении;
+        watch - не проверять файл при чтении, пока фоновый наблюдатель не сообщит об изменении"""
+        self.file_path = file_path
+        self.check_interval = check_interval
+        self.incremental = incremental
+        self.fast_load = fast_load
+        self.use_cache = use_cache
+        self.cache_path = f"{file_path}.cache"
+        self.invalid_count = 0
+        self.invalid_samples: List[str] = []
+        # Читатели берут текущий снимок без блокировок, перезагрузка собирает новый и подменяет ссылку
+        self._snapshot = NumberSnapshot(array('q'), 0)
+        self._reload_lock = threading.RLock()
+        self.last_modified_time: float = 0
+        # (mtime_ns, размер, inode) файла на момент последней загрузки
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._next_check = 0.0
+        # Проверка и сброс _next_check в _check_file и invalidate() из потока наблюдателя
+        # выполняются под этой блокировкой, иначе сигнал об изменении может быть затёрт
+        self._next_check_lock = Lock()
+        self._watcher: Optional['FileWatcher'] = None
+        # Состояние для инкрементальной дозагрузки
+        self._inode: Optional[int] = None
+        self._offset: int = 0  # позиция сразу после последней завершённой строки
+        self._size: int = 0  # сколько байт файла уже прочитано
+        self._tail_marker: bytes = b''
+        self._has_partial_line = False  # последняя строка без '\n' уже попала в numbers
+        self.generation = 0
+        # Без предзагрузки данные читаются при первом обращении, а iter_chunks читает файл потоком
+        self._loaded = False
+        if preload:
+            self.load_data()
+        if watch:
+            self._watcher = FileWatcher(file_path, self.invalidate, check_interval or 1.0)
+            self._watcher.start()
+
+    def close(self) -> None:
+        """Останавливает фоновый наблюдатель, если он был запущен"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+            self.invalidate()
+
+    @property
+    def numbers(self) -> array:
+        """Буфер int64 текущего снимка; изменять его нельзя"""
+        return self._snapshot._numbers
+
+    def get_snapshot(self) -> NumberSnapshot:
+        """Согласованная пара: числа и их поколение"""
+        self.check_for_updates()
+        return self._snapshot
+
+    def _publish(self, numbers: array) -> None:
+        # Присваивание ссылки атомарно: читатель видит либо старый снимок, либо новый целиком
+        self._snapshot = NumberSnapshot(numbers, self.generation)
+
+    @metrics.timed('file_source_load')
+    def load_data(self) -> None:
+        with self._reload_lock:
+            self._load_data()
+
+    def _load_data(self) -> None:
+        self.generation += 1
+        self._loaded = True
+        try:
+            if os.path.exists(self.file_path):
+                stat = os.stat(self.file_path)
+                self.last_modified_time = stat.st_mtime
+                self._signature = self._stat_signature(stat)
+                self._inode = stat.st_ino
+                self._offset = 0
+                self._has_partial_line = False
+
+                with open(self.file_path, 'rb') as file:
+                    if self.use_cache:
+                        if self._load_cache(file, stat):
+                            return
+                        # Проверка кэша сдвигает позицию в файле и могла опубликовать часть данных:
+                        # разбираем файл заново с начала под новым поколением
+                        file.seek(0)
+                        self._offset = 0
+                        self._has_partial_line = False
+                        self.generation += 1
+                    self._publish(self._read_lines(file))
+                if self.use_cache:
+                    self._write_cache()
+            else:
+                print(f"File {self.file_path} does not exist")
+                self._signature = None
+                self._publish(array('q'))
+
+        except IOError as e:
+            print(f"Error reading file: {e}")
+            self._publish(array('q'))
+
+    @metrics.timed('file_source_append')
+    def load_appended(self) -> bool:
+        """Дочитывает только строки, дописанные в конец файла.
+        Возвращает False, если уже прочитанная часть файла изменилась"""
+        with self._reload_lock, open(self.file_path, 'rb') as file:
+            file.seek(self._size - len(self._tail_marker))
+            if file.read(len(self._tail_marker)) != self._tail_marker:
+                return False
+
+            # Незавершённая строка могла быть дописана - разбираем её заново
+            keep = len(self.numbers)
+            if self._has_partial_line:
+                keep -= 1
+                self.generation += 1  # последнее число заменяется - это уже не дописывание
+            self._has_partial_line = False
+            file.seek(self._offset)
+            self._extend_numbers(keep, self._read_lines(file))
+        return True
+
+    def _load_cache(self, file, stat: os.stat_result) -> bool:
+        """Загружает числа из бинарного кэша, если он соответствует файлу.
+        Если файл с тех пор только дописан, дочитывает новый хвост и обновляет кэш"""
+        try:
+            with open(self.cache_path, 'rb') as cache, \
+                    mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                (magic, version, byteorder, mtime_ns, size, inode, fingerprint,
+                 count, offset, has_partial_line, marker_length, marker) = self.CACHE_HEADER.unpack_from(mapped)
+                if (magic != self.CACHE_MAGIC or version != self.CACHE_VERSION
+                        or byteorder != sys.byteorder[0].encode()):
+                    return False
+
+                fresh = stat.st_mtime_ns == mtime_ns and stat.st_size == size
+                appended = self.incremental and stat.st_ino == inode and stat.st_size > size
+                if not (fresh or appended) or self._fingerprint(file, size) != fingerprint:
+                    return False
+
+                numbers = array('q')
+                end = self.CACHE_DATA_OFFSET + count * numbers.itemsize
+                if len(mapped) != end:
+                    return False
+                with memoryview(mapped) as view, view[self.CACHE_DATA_OFFSET:end] as payload:
+                    numbers.frombytes(payload)
+        except (OSError, ValueError, struct.error):
+            return False
+
+        self._publish(numbers)
+        self._offset = offset
+        self._size = size
+        self._has_partial_line = has_partial_line
+        self._tail_marker = marker[:marker_length]
+        self.invalid_count = 0
+        self.invalid_samples = []
+
+        if appended:
+            if not self.load_appended():
+                return False
+            self._write_cache()
+        return True
+
+    def _write_cache(self) -> None:
+        try:
+            stat = os.stat(self.file_path)
+            if stat.st_size != self._size or self._stat_signature(stat) != self._signature:
+                return  # файл изменился во время разбора - такой кэш сразу устарел бы
+
+            with open(self.file_path, 'rb') as file:
+                fingerprint = self._fingerprint(file, self._size)
+            header = self.CACHE_HEADER.pack(
+                self.CACHE_MAGIC, self.CACHE_VERSION, sys.byteorder[0].encode(),
+                stat.st_mtime_ns, self._size, stat.st_ino, fingerprint, len(self.numbers),
+                self._offset, self._has_partial_line, len(self._tail_marker), self._tail_marker)
+
+            # Пишем во временный файл и атомарно подменяем, чтобы читатели не увидели половину кэша
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, 'wb') as cache:
+                cache.write(header.ljust(self.CACHE_DATA_OFFSET, b'\0'))
+                cache.write(self.numbers)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Error writing cache file: {e}")
+
+    def _fingerprint(self, file, size: int) -> bytes:
+        import hashlib
+        file.seek(0)
+        sample = file.read(min(size, self.CACHE_FINGERPRINT_SIZE))
+        return hashlib.blake2b(sample, digest_size=16).digest()
+
+    def _extend_numbers(self, keep: int, tail: array) -> None:
+        numbers = self.numbers
+        if keep < len(numbers):
+            # Последнее число заменяется - копируем, чтобы не испортить уже выданные снимки
+            numbers = numbers[:keep] + tail
+        else:
+            try:
+                # Старые снимки видят только свой префикс, поэтому дописываем в тот же буфер
+                numbers.extend(tail)
+            except BufferError:
+                # Буфер занят выданным представлением - собираем новый, старый остаётся у читателей
+                numbers = numbers + tail
+        self._publish(numbers)
+
+    def _read_lines(self, file) -> array:
+        """Разбирает файл от текущей позиции до конца и сдвигает смещения"""
+        self.invalid_count = 0
+        self.invalid_samples = []
+
+        numbers = None
+        if self.fast_load:
+            try:
+                numbers = self._read_mapped(file)
+            except (ValueError, OSError):
+                pass  # пустой файл или файл без поддержки mmap - читаем построчно
+        if numbers is None:
+            numbers = self._read_line_by_line(file)
+
+        self._size = file.tell()
+        file.seek(max(0, self._size - self.TAIL_MARKER_SIZE))
+        self._tail_marker = file.read(self._size - file.tell())
+
+        if self.invalid_count:
+            print(f"Skipped {self.invalid_count} invalid lines, e.g.: {self.invalid_samples}")
+        return numbers
+
+    def _read_mapped(self, file) -> array:
+        start = file.tell()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            complete_end = mapped.rfind(b'\n', start) + 1 or start
+            numbers = array('q')
+
+            position = start
+            while position < complete_end:
+                end = min(position + self.CHUNK_SIZE, complete_end)
+                if end < complete_end:
+                    # Блок должен заканчиваться на границе строки
+                    end = mapped.rfind(b'\n', position, end) + 1 or mapped.find(b'\n', end) + 1
+                self._parse_chunk(mapped[position:end], numbers)
+                position = end
+
+            # Производитель мог ещё не дописать последнюю строку: смещение не сдвигаем
+            count_before = len(numbers)
+            self._parse_chunk(mapped[complete_end:size], numbers)
+            self._has_partial_line = len(numbers) > count_before
+
+        self._offset = complete_end
+        file.seek(size)
+        return numbers
+
+    def _parse_chunk(self, chunk: bytes, numbers: array) -> None:
+        try:
+            # Быстрый путь: весь блок состоит из корректных чисел
+            numbers.extend(array('q', map(int, filter(None, chunk.split(b'\n')))))
+        except (ValueError, OverflowError):
+            for raw_line in chunk.split(b'\n'):
+                self._parse_line(raw_line, numbers)
+
+    def _read_line_by_line(self, file) -> array:
+        numbers = array('q')
+        for raw_line in file:
+            if not raw_line.endswith(b'\n'):
+                # Производитель мог ещё не дописать строку: смещение не сдвигаем
+                self._has_partial_line = self._parse_line(raw_line, numbers)
+                break
+            self._parse_line(raw_line, numbers)
+            self._offset += len(raw_line)
+        return numbers
+
+    def _parse_line(self, raw_line: bytes, numbers: array) -> bool:
+        line = raw_line.decode('utf-8', errors='replace').strip()
+        if line:
+            try:
+                numbers.append(int(line))
+                return True
+            except ValueError:
+                self._report_invalid(line)
+            except OverflowError:
+                self._report_invalid(f"{line} (out of int64 range)")
+        return False
+
+    def _report_invalid(self, line: str) -> None:
+        metrics.increment('file_source_invalid_lines')
+        self.invalid_count += 1
+        if len(self.invalid_samples) < self.INVALID_SAMPLE_SIZE:
+            self.invalid_samples.append(line)
+
+    def get_numbers(self) -> List[int]:
+        self.check_for_updates()
+        return self._snapshot.view().tolist()
+
+    def get_numbers_view(self) -> memoryview:
+        """Неизменяемое представление чисел без копирования буфера"""
+        self.check_for_updates()
+        return self._snapshot.view()
+
+    def get_data_version(self) -> int:
+        return self._snapshot.generation
+
+    def refresh_data(self) -> None:
+        self.load_data()
+
+    @metrics.timed('file_source_check')
+    def check_for_updates(self) -> None:
+        if not self._loaded:
+            self.load_data()
+            return
+
+        # Если другой поток уже перезагружает данные, не ждём его и отдаём текущий снимок
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._check_file()
+        finally:
+            self._reload_lock.release()
+
+    def _check_file(self) -> None:
+        if self.check_interval or self._watcher is not None:
+            with self._next_check_lock:
+                now = time.monotonic()
+                if now < self._next_check:
+                    return
+                # С наблюдателем следующая проверка будет только после invalidate().
+                # Сброс делается до stat: изменение после него снова вызовет invalidate()
+                self._next_check = float('inf') if self._watcher is not None else now + self.check_interval
+
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"Error checking file updates: {e}")
+            return
+
+        signature = self._stat_signature(stat)
+        if signature != self._signature:
+            if self._is_append(stat):
+                self.last_modified_time = stat.st_mtime
+                self._signature = signature
+                if self.load_appended():
+                    print("File append detected. Loaded new lines")
+                    return
+            print("File change detected. Reloading data...")
+            self.refresh_data()
+
+    def invalidate(self) -> None:
+        with self._next_check_lock:
+            self._next_check = 0.0
+
+    @staticmethod
+    def _stat_signature(stat: os.stat_result) -> Tuple[int, int, int]:
+        # Наносекунды, размер и inode вместе не пропускают быстрые перезаписи и ротацию
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[memoryview]:
+        """Отдаёт числа блоками. Потоком, с одним разобранным блоком в памяти, файл читается
+        только пока данные не загружены: источник создан с preload=False (см.
+        DataSourceFactory.create_streaming_file_data_source) и к нему ещё не было обычных
+        обращений. После загрузки блоки нарезаются из уже загруженного буфера"""
+        if self._loaded:
+            yield from super().iter_chunks(chunk_size)
+            return
+
+        self.invalid_count = 0
+        self.invalid_samples = []
+        try:
+            with open(self.file_path, 'rb') as file:
+                remainder = b''
+                while True:
+                    block = file.read(self.CHUNK_SIZE)
+                    if block:
+                        data = remainder + block
+                        end = data.rfind(b'\n') + 1
+                        data, remainder = data[:end], data[end:]
+                    else:
+                        data, remainder = remainder, b''
+
+                    numbers = array('q')
+                    self._parse_chunk(data, numbers)
+                    view = memoryview(numbers).toreadonly()
+                    for start in range(0, len(numbers), chunk_size):
+                        yield view[start:start + chunk_size]
+                    if not block:
+                        break
+        except IOError as e:
+            print(f"Error reading file: {e}")
+
+        if self.invalid_count:
+            print(f"Skipped {self.invalid_count} invalid lines, e.g.: {self.invalid_samples}")
+
+    def _is_append(self, stat: os.stat_result) -> bool:
+        # Ротация меняет inode, усечение уменьшает размер - в обоих случаях нужна полная перезагрузка
+        return (self.incremental
+                and stat.st_ino == self._inode
+                and stat.st_size > self._size)
+
+    def get_data_source_info(self) -> str:
+        if not self._loaded:
+            return f"File: {self.file_path} (Numbers: not loaded)"
+        return f"File: {self.file_path} (Numbers: {len(self._snapshot)})"
+
+# Прокси для логирования (Proxy)
+class LoggingNumberDataSourceProxy(NumberDataSource):
+    def __init__(self, real_data_source: NumberDataSource, sample_rate: float = 1.0,
+                 summary_interval: Optional[float] = None):
+        """sample_rate - доля обращений, которые пишутся в лог построчно (1.0 - все, 0 - ни одного);
+        summary_interval - раз в сколько секунд писать сводку по всем обращениям"""
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self.real_data_source = real_data_source
+        self.logger = Logger()
+        self.sample_rate = sample_rate
+        self.summary_interval = summary_interval
+        # Счётчики за всё время работы прокси
+        self.total_accesses = 0
+        self.total_bytes = 0
+        # Счётчики текущего окна сводки
+        self._stats_lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_latencies: List[float] = []
+        self._window_bytes = 0
+        if summary_interval is not None:
+            # Сводка пишется при обращении после конца интервала; последнее окно, после которого
+            # обращений не было, сбрасывается в close() или при выходе из программы.
+            # Logger регистрирует своё закрытие раньше, поэтому при выходе сводка успеет в лог
+            atexit.register(_flush_summary_at_exit, weakref.ref(self))
+
+    @metrics.timed('proxy_get_numbers')
+    def get_numbers(self) -> List[int]:
+        sampled = self._start_access()
+        if sampled:
+            info = self.real_data_source.get_data_source_info()
+            self.logger.log(f"Accessing numbers from: {info}")
+
+        start = time.perf_counter()
+        numbers = self.real_data_source.get_numbers()
+        self._finish_access(start, len(numbers) * 8)
+        if sampled:
+            self.logger.log(f"Retrieved {len(numbers)} numbers")
+
+        return numbers
+
+    @metrics.timed('proxy_get_numbers_view')
+    def get_numbers_view(self) -> Sequence[int]:
+        sampled = self._start_access()
+        if sampled:
+            info = self.real_data_source.get_data_source_info()
+            self.logger.log(f"Accessing numbers view from: {info}")
+
+        start = time.perf_counter()
+        numbers = self.real_data_source.get_numbers_view()
+        self._finish_access(start, getattr(numbers, 'nbytes', len(numbers) * 8))
+        if sampled:
+            self.logger.log(f"Retrieved view of {len(numbers)} numbers")
+
+        return numbers
+
+    def get_data_version(self) -> Optional[int]:
+        return self.real_data_source.get_data_version()
+
+    @metrics.timed('proxy_get_snapshot')
+    def get_snapshot(self) -> NumberSnapshot:
+        sampled = self._start_access()
+        if sampled:
+            info = self.real_data_source.get_data_source_info()
+            self.logger.log(f"Accessing numbers view from: {info}")
+
+        start = time.perf_counter()
+        snapshot = self.real_data_source.get_snapshot()
+        self._finish_access(start, len(snapshot) * 8)
+        if sampled:
+            self.logger.log(f"Retrieved view of {len(snapshot)} numbers")
+
+        return snapshot
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[Sequence[int]]:
+        sampled = self._start_access()
+        if sampled:
+            info = self.real_data_source.get_data_source_info()
+            self.logger.log(f"Streaming numbers from: {info}")
+
+        start = time.perf_counter()
+        count = 0
+        size = 0
+        for chunk in self.real_data_source.iter_chunks(chunk_size):
+            count += len(chunk)
+            size += getattr(chunk, 'nbytes', len(chunk) * 8)
+            yield chunk
+        self._finish_access(start, size)
+        if sampled:
+            self.logger.log(f"Streamed {count} numbers")
+
+    def check_for_updates(self) -> None:
+        self.real_data_source.check_for_updates()
+
+    def invalidate(self) -> None:
+        self.real_data_source.invalidate()
+
+    @metrics.timed('proxy_get_aggregates')
+    def get_aggregates(self) -> Optional['NumberAggregates']:
+        sampled = self._start_access()
+        if sampled:
+            info = self.real_data_source.get_data_source_info()
+            self.logger.log(f"Accessing aggregates from: {info}")
+
+        start = time.perf_counter()
+        aggregates = self.real_data_source.get_aggregates()
+        self._finish_access(start, 0)
+        return aggregates
+
+    def refresh_data(self) -> None:
+        info = self.real_data_source.get_data_source_info()
+        self.logger.log(f"Refreshing data for: {info}")
+
+        self.real_data_source.refresh_data()
+        self.logger.log("Data refreshed successfully")
+
+    def get_data_source_info(self) -> str:
+        return f"{self.real_data_source.get_data_source_info()} (with logging proxy)"
+
+    def get_access_stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {'accesses': self.total_accesses, 'bytes_returned': self.total_bytes}
+
+    def flush_summary(self) -> None:
+        """Пишет сводку по текущему окну, не дожидаясь конца интервала"""
+        with self._stats_lock:
+            summary = self._take_summary()
+        if summary:
+            self.logger.log(summary)
+
+    def close(self) -> None:
+        """Пишет сводку последнего окна и закрывает реальный источник, если он это умеет"""
+        self.flush_summary()
+        close = getattr(self.real_data_source, 'close', None)
+        if close is not None:
+            close()
+
+    def _start_access(self) -> bool:
+        """Учитывает обращение и решает, писать ли его в лог построчно"""
+        with self._stats_lock:
+            self.total_accesses += 1
+            accesses = self.total_accesses
+        # Обращение n пишется, если ceil(n * rate) вырос: ровно доля rate обращений при любом rate,
+        # первое обращение пишется всегда (если rate > 0)
+        rate = self.sample_rate
+        return math.ceil(accesses * rate) != math.ceil((accesses - 1) * rate)
+
+    def _finish_access(self, start: float, size: int) -> None:
+        latency = time.perf_counter() - start
+        summary = None
+        with self._stats_lock:
+            self.total_bytes += size
+            if self.summary_interval is not None:
+                self._window_latencies.append(latency)
+                self._window_bytes += size
+                if time.monotonic() - self._window_start >= self.summary_interval:
+                    summary = self._take_summary()
+        if summary:
+            self.logger.log(summary)
+
+    def _take_summary(self) -> Optional[str]:
+        # Вызывается под self._stats_lock
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        latencies = sorted(self._window_latencies)
+        window_bytes = self._window_bytes
+        self._window_start = now
+        self._window_latencies = []
+        self._window_bytes = 0
+        if not latencies:
+            return None
+
+        p50 = latencies[int((len(latencies) - 1) * 0.50)] * 1000
+        p99 = latencies[int((len(latencies) - 1) * 0.99)] * 1000
+        return (f"{len(latencies)} accesses, p50 {p50:.3f} ms, p99 {p99:.3f} ms, "
+                f"{window_bytes} bytes returned in last {elapsed:.1f}s")
+
+def _flush_summary_at_exit(proxy_ref: 'weakref.ref[LoggingNumberDataSourceProxy]') -> None:
+    # Слабая ссылка: регистрация в atexit не должна продлевать жизнь прокси
+    proxy = proxy_ref()
+    if proxy is not None:
+        proxy.flush_summary()
+
+# Логгер (Singleton)
+class Logger:
+    _instance = None
+    _lock: Lock = Lock()
+    # Служебный элемент очереди: остановить фоновую запись
+    _STOP = object()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(Logger, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if not self._initialized:
+            self.log_file = "number_data_access.log"
+            self.echo = True
+            self.overflow_policy = 'block'
+            self.flush_interval = 1.0
+            self.flush_size = 100
+            self.dropped_messages = 0
+            # Защищает _queue, _writer и dropped_messages: close() не должен проскочить
+            # между проверкой очереди и постановкой в неё сообщения
+            self._queue_lock = Lock()
+            self._queue: Optional[queue.Queue] = None
+            self._writer: Optional[threading.Thread] = None
+            self._timestamp_second = -1
+            self._timestamp_text = ""
+            self._initialized = True
+            self.initialize_log_file()
+            atexit.register(self.close)
+
+    def initialize_log_file(self):
+        try:
+            Path(self.log_file).touch(exist_ok=True)
+            self.log("Log file initialized")
+        except IOError as e:
+            print(f"Error creating log file: {e}")
+
+    def configure(self, buffered: bool = False, echo: bool = True, max_queue_size: int = 10000,
+                  overflow_policy: str = 'block', flush_interval: float = 1.0,
+                  flush_size: int = 100) -> None:
+        """Настраивает режим записи.
+        В буферизованном режиме сообщения уходят в ограниченную очередь, которую разбирает
+        фоновый поток с одним открытым файлом. При переполнении очереди 'block' ждёт
+        освобождения места, 'drop' отбрасывает сообщение и увеличивает dropped_messages"""
+        if overflow_policy not in ('block', 'drop'):
+            raise ValueError("overflow_policy must be 'block' or 'drop'")
+
+        self.close()
+        self.echo = echo
+        self.overflow_policy = overflow_policy
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        if buffered:
+            messages: queue.Queue = queue.Queue(maxsize=max_queue_size)
+            writer = threading.Thread(target=self._write_loop, args=(messages,), name="LoggerWriter",
+                                      daemon=True)
+            writer.start()
+            with self._queue_lock:
+                self._queue = messages
+                self._writer = writer
+
+    def log(self, message: str):
+        log_message = f"[{self._timestamp()}] {message}"
+
+        if self.echo:
+            print(log_message)  # Вывод в консоль
+
+        with self._queue_lock:
+            messages = self._queue
+            if messages is not None:
+                # Ставим в очередь под блокировкой: STOP из close() не окажется раньше сообщения.
+                # Фоновый поток разбирает очередь без этой блокировки, поэтому put не зависнет
+                if self.overflow_policy == 'drop':
+                    try:
+                        messages.put_nowait(log_message)
+                    except queue.Full:
+                        self.dropped_messages += 1
+                else:
+                    messages.put(log_message)
+                return
+
+        # Запись в файл
+        try:
+            with open(self.log_file, 'a', encoding='utf-8') as file:
+                file.write(log_message + '\n')
+        except IOError as e:
+            print(f"Error writing to log file: {e}")
+
+    def flush(self) -> None:
+        """Дожидается записи всех сообщений, поставленных в очередь до вызова"""
+        done = threading.Event()
+        with self._queue_lock:
+            if self._queue is None:
+                return
+            self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Записывает оставшиеся сообщения и останавливает фоновый поток"""
+        with self._queue_lock:
+            writer, messages = self._writer, self._queue
+            self._writer = None
+            self._queue = None
+            if writer is not None:
+                messages.put(self._STOP)
+        if writer is not None:
+            writer.join()
+
+    def _timestamp(self) -> str:
+        # Строка времени меняется раз в секунду - не форматируем её на каждое сообщение
+        now = time.time()
+        second = int(now)
+        if second != self._timestamp_second:
+            self._timestamp_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._timestamp_second = second
+        return self._timestamp_text
+
+    def _write_loop(self, messages: queue.Queue) -> None:
+        batch: List[str] = []
+        try:
+            file = open(self.log_file, 'a', encoding='utf-8')
+        except IOError as e:
+            print(f"Error opening log file: {e}")
+            file = None
+
+        deadline = None
+        while True:
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                item = messages.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # истёк интервал сброса
+
+            if isinstance(item, str):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(batch) < self.flush_size:
+                    continue
+
+            if batch and file is not None:
+                try:
+                    file.write('\n'.join(batch) + '\n')
+                    file.flush()
+                except IOError as e:
+                    print(f"Error writing to log file: {e}")
+            batch.clear()
+            deadline = None
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                break
+
+        if file is not None:
+            file.close()
+
+# Агрегаты по набору чисел (Value Object)
+@dataclass(frozen=True)
+class NumberAggregates:
+    count: int = 0
+    total: int = 0
+    minimum: int = 0
+    maximum: int = 0
+    sum_of_squares: int = 0
+
+    @classmethod
+    def from_values(cls, numbers: Sequence[int]) -> 'NumberAggregates':
+        if not len(numbers):
+            return cls()
+        # Встроенные функции обходят буфер на уровне C - это быстрее одного цикла на Python
+        return cls(len(numbers), sum(numbers), min(numbers), max(numbers),
+                   sum(map(operator.mul, numbers, numbers)))
+
+    def merge(self, other: 'NumberAggregates') -> 'NumberAggregates':
+        if not other.count:
+            return self
+        if not self.count:
+            return other
+        return NumberAggregates(self.count + other.count,
+                                self.total + other.total,
+                                min(self.minimum, other.minimum),
+                                max(self.maximum, other.maximum),
+                                self.sum_of_squares + other.sum_of_squares)
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        # Суммы целые и точные, поэтому считаем без потери точности
+        if not self.count:
+            return 0.0
+        return (self.count * self.sum_of_squares - self.total * self.total) / (self.count * self.count)
+
+# Сервис для операций с числами (Facade)
+class NumberOperationsService:
+    def __init__(self, data_source: NumberDataSource):
+        self.data_source = data_source
+        # Кэш агрегатов и отсортированных данных, ключ - (поколение, количество чисел)
+        # Ключ и значение храним одним кортежем, чтобы обновление было атомарным для потоков
+        self._aggregates_cache: Optional[Tuple[Tuple[int, int], NumberAggregates]] = None
+        self._sorted: List[int] = []
+        self._sorted_key: Optional[Tuple[int, int]] = None
+
+    @metrics.timed('service_get_aggregates')
+    def get_aggregates(self) -> NumberAggregates:
+        # Числа и поколение берём из одного снимка: иначе перезагрузка между двумя вызовами
+        # дала бы ключ кэша из старого поколения и длины новых данных
+        return self.snapshot_aggregates(self.data_source.get_snapshot())
+
+    def snapshot_aggregates(self, snapshot: NumberSnapshot) -> NumberAggregates:
+        """Агрегаты снимка: готовые от источника или посчитанные с учётом кэша"""
+        if snapshot.aggregates is not None:
+            return snapshot.aggregates
+        return self.compute_aggregates(snapshot.view(), snapshot.generation)
+
+    def compute_aggregates(self, numbers: Sequence[int], version: Optional[int]) -> NumberAggregates:
+        """Агрегаты для уже полученного представления с учётом кэша по версии данных"""
+        if version is None:
+            return NumberAggregates.from_values(numbers)
+
+        key = (version, len(numbers))
+        cached = self._aggregates_cache
+        if cached is not None and cached[0] == key:
+            metrics.increment('aggregates_cache_hits')
+            return cached[1]
+
+        if cached is not None and cached[0][0] == version and cached[0][1] < key[1]:
+            # Данные только дописаны - досчитываем агрегаты по новому хвосту
+            metrics.increment('aggregates_delta_updates')
+            aggregates = cached[1].merge(NumberAggregates.from_values(numbers[cached[0][1]:]))
+        else:
+            metrics.increment('aggregates_full_computations')
+            aggregates = NumberAggregates.from_values(numbers)
+        self._aggregates_cache = (key, aggregates)
+        return aggregates
+
+    @metrics.timed('service_get_streaming_aggregates')
+    def get_streaming_aggregates(self, chunk_size: int = 65536) -> NumberAggregates:
+        """Агрегаты по блокам из iter_chunks. Память не зависит от размера данных, если источник
+        отдаёт блоки потоком (create_streaming_file_data_source, шарды); у загруженного
+        источника блоки нарезаются из буфера, который уже в памяти"""
+        return reduce(NumberAggregates.merge,
+                      map(NumberAggregates.from_values, self.data_source.iter_chunks(chunk_size)),
+                      NumberAggregates())
+
+    def get_sum(self) -> int:
+        return self.get_aggregates().total
+
+    def get_max(self) -> int:
+        return self.get_aggregates().maximum
+
+    def get_min(self) -> int:
+        return self.get_aggregates().minimum
+
+    def get_average(self) -> float:
+        return self.get_aggregates().average
+
+    def get_count(self) -> int:
+        return self.get_aggregates().count
+
+    def get_variance(self) -> float:
+        return self.get_aggregates().variance
+
+    @metrics.timed('service_get_percentile')
+    def get_percentile(self, percent: float) -> float:
+        """Перцентиль с линейной интерполяцией, percent в диапазоне [0, 100]"""
+        if not 0 <= percent <= 100:
+            raise ValueError("Percent must be between 0 and 100")
+
+        snapshot = self.data_source.get_snapshot()
+        version = snapshot.generation
+        numbers = snapshot.view()
+        key = (version, len(numbers))
+        if version is None or key != self._sorted_key:
+            if version is not None and self._sorted_key is not None and self._sorted_key[0] == version:
+                # Timsort сливает уже отсортированную часть с новым хвостом почти за линейное время
+                self._sorted.extend(numbers[self._sorted_key[1]:])
+                self._sorted.sort()
+            else:
+                self._sorted = sorted(numbers)
+            self._sorted_key = key
+
+        if not self._sorted:
+            return 0.0
+        position = (len(self._sorted) - 1) * percent / 100
+        lower = int(position)
+        upper = min(lower + 1, len(self._sorted) - 1)
+        return self._sorted[lower] + (self._sorted[upper] - self._sorted[lower]) * (position - lower)
+
+    def refresh_data(self):
+        self.data_source.refresh_data()
+
+    @metrics.timed('service_perform_all_operations')
+    def perform_all_operations(self):
+        """Выполняет все операции и возвращает результаты"""
+        # Числа и агрегаты из одного снимка; шарды при этом не склеиваются в общий буфер
+        snapshot = self.data_source.get_snapshot()
+        numbers = snapshot.view()
+        aggregates = self.snapshot_aggregates(snapshot)
+
+        return {
+            'numbers': numbers,
+            'sum': aggregates.total,
+            'max': aggregates.maximum,
+            'min': aggregates.minimum,
+            'average': aggregates.average,
+            'count': aggregates.count,
+            'variance': aggregates.variance
+        }
+
+def load_number_shard(file_path: str) -> Tuple[array, NumberAggregates]:
+    """Разбирает один шард; функция верхнего уровня, чтобы её можно было передать в пул процессов"""
+    numbers = FileNumberDataSource(file_path).numbers
+    return numbers, NumberAggregates.from_values(numbers)
+
+# Источник данных из множества файлов-шардов (Composite)
+class ShardedNumberDataSource(NumberDataSource):
+    # При меньшем числе изменившихся шардов запуск пула процессов дороже самого разбора
+    PARALLEL_THRESHOLD = 2
+
+    def __init__(self, pattern: str, max_workers: Optional[int] = None, check_interval: float = 0.0):
+        """check_interval - не чаще какого интервала (в секундах) перечислять шарды и проверять их
+        при чтении; invalidate() снимает ограничение до следующей проверки"""
+        # Каталог означает все файлы в нём, иначе pattern - это glob-шаблон
+        self.pattern = os.path.join(pattern, '*') if os.path.isdir(pattern) else pattern
+        self.max_workers = max_workers
+        self.check_interval = check_interval
+        self._next_check = 0.0
+        self._next_check_lock = Lock()
+        # путь -> (mtime_ns, размер, inode), числа шарда, агрегаты шарда
+        self.shards: Dict[str, Tuple[Tuple[int, int, int], array, NumberAggregates]] = {}
+        self.generation = 0
+        # Шарды, поколение и агрегаты текущего состояния; заменяется одним присваиванием
+        self._snapshot = ShardedNumberSnapshot((), 0, NumberAggregates())
+        self._combined: Optional[NumberSnapshot] = None
+        self.load_data()
+
+    def load_data(self) -> None:
+        # Полная загрузка тоже считается проверкой
+        with self._next_check_lock:
+            self._next_check = time.monotonic() + self.check_interval
+        self.shards = {}
+        self._update_shards()
+
+    def refresh_data(self) -> None:
+        self.load_data()
+
+    def check_for_updates(self) -> None:
+        # glob и stat каждого шарда на каждое чтение дороги - проверяем не чаще check_interval
+        if self.check_interval:
+            with self._next_check_lock:
+                now = time.monotonic()
+                if now < self._next_check:
+                    return
+                self._next_check = now + self.check_interval
+        changed, removed = self._update_shards()
+        if changed or removed:
+            print(f"Shard changes detected: {changed} reloaded, {removed} removed")
+
+    def invalidate(self) -> None:
+        with self._next_check_lock:
+            self._next_check = 0.0
+
+    def _update_shards(self) -> Tuple[int, int]:
+        signatures = {}
+        for path in sorted(glob.glob(self.pattern)):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # шард удалили между glob и stat
+            if S_ISREG(stat.st_mode):
+                signatures[path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        changed = [path for path, signature in signatures.items()
+                   if path not in self.shards or self.shards[path][0] != signature]
+        removed = [path for path in self.shards if path not in signatures]
+        if not changed and not removed and self.generation:
+            return 0, 0
+
+        shards = {path: shard for path, shard in self.shards.items() if path in signatures}
+        for path, (numbers, aggregates) in zip(changed, self._load_shards(changed)):
+            shards[path] = (signatures[path], numbers, aggregates)
+        self.shards = dict(sorted(shards.items()))
+        aggregates = reduce(NumberAggregates.merge,
+                            (shard_aggregates for _, _, shard_aggregates in self.shards.values()),
+                            NumberAggregates())
+        self.generation += 1
+        self._snapshot = ShardedNumberSnapshot([numbers for _, numbers, _ in self.shards.values()],
+                                               self.generation, aggregates)
+        return len(changed), len(removed)
+
+    def _load_shards(self, paths: List[str]) -> List[Tuple[array, NumberAggregates]]:
+        if len(paths) < self.PARALLEL_THRESHOLD or self.max_workers == 1:
+            return [load_number_shard(path) for path in paths]
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(load_number_shard, paths))
+
+    def get_aggregates(self) -> NumberAggregates:
+        return self.get_snapshot().aggregates
+
+    def get_snapshot(self) -> ShardedNumberSnapshot:
+        """Шарды и агрегаты одного поколения после единственной проверки файлов"""
+        self.check_for_updates()
+        return self._snapshot
+
+    def get_numbers(self) -> List[int]:
+        return self.get_snapshot().view().tolist()
+
+    def get_numbers_view(self) -> memoryview:
+        """Склеивает шарды в один буфер int64 только по запросу и кэширует его до изменения шардов.
+        Сервису склейка не нужна: он работает со снимком из get_snapshot"""
+        snapshot = self.get_snapshot()
+        combined = self._combined
+        if combined is None or combined.generation != snapshot.generation:
+            numbers = array('q')
+            for shard_numbers in snapshot.shards:
+                numbers.extend(shard_numbers)
+            combined = NumberSnapshot(numbers, snapshot.generation, snapshot.aggregates)
+            self._combined = combined
+        return combined.view()
+
+    def get_data_version(self) -> int:
+        return self._snapshot.generation
+
+    def iter_chunks(self, chunk_size: int = 65536) -> Iterator[memoryview]:
+        # Идём по шардам, не склеивая их в общий буфер
+        for numbers in self.get_snapshot().shards:
+            view = memoryview(numbers).toreadonly()
+            for start in range(0, len(numbers), chunk_size):
+                yield view[start:start + chunk_size]
+
+    def get_data_source_info(self) -> str:
+        snapshot = self._snapshot
+        return f"Shards: {self.pattern} (Files: {len(snapshot.shards)}, Numbers: {len(snapshot)})"
+
+# Фабрика для создания источников данных (Factory Method)
+class DataSourceFactory:
+    @staticmethod
+    def create_file_data_source(file_path: str, incremental: bool = False, fast_load: bool = True,
+                                use_cache: bool = False, preload: bool = True, sample_rate: float = 1.0,
+                                summary_interval: Optional[float] = None, check_interval: float = 0.0,
+                                watch: bool = False) -> NumberDataSource:
+        real_data_source = FileNumberDataSource(file_path, incremental, fast_load, use_cache, preload,
+                                                check_interval, watch)
+        return LoggingNumberDataSourceProxy(real_data_source, sample_rate, summary_interval)
+
+    @staticmethod
+    def create_streaming_file_data_source(file_path: str, fast_load: bool = True, sample_rate: float = 1.0,
+                                          summary_interval: Optional[float] = None) -> NumberDataSource:
+        """Источник без предзагрузки для iter_chunks и get_streaming_aggregates: файл читается
+        потоком при каждом проходе. Обычные методы (get_numbers, get_aggregates...) загрузят
+        файл в память целиком, и дальше блоки будут браться из загруженного буфера"""
+        real_data_source = FileNumberDataSource(file_path, fast_load=fast_load, preload=False)
+        return LoggingNumberDataSourceProxy(real_data_source, sample_rate, summary_interval)
+
+    @staticmethod
+    def create_sharded_data_source(pattern: str, max_workers: Optional[int] = None, sample_rate: float = 1.0,
+                                   summary_interval: Optional[float] = None,
+                                   check_interval: float = 0.0) -> NumberDataSource:
+        real_data_source = ShardedNumberDataSource(pattern, max_workers, check_interval)
+        return LoggingNumberDataSourceProxy(real_data_source, sample_rate, summary_interval)
+
+# Демонстрационный класс
+class NumberDataApplication:
+    @staticmethod
+    def create_test_file(filename: str):
+        try:
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write("10\n")
+                file.write("20\n")
+                file.write("30\n")
+                file.write("40\n")
+                file.write("50\n")
+            print(f"Created test file: {filename}")
+        except IOError as e:
+            print(f"Error creating test file: {e}")
+
+    @staticmethod
+    def update_test_file(filename: str):
+        try:
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write("5\n")
+                file.write("15\n")
+                file.write("25\n")
+                file.write("35\n")
+                file.write("45\n")
+                file.write("55\n")  # Добавляем еще одно число
+            print(f"Updated test file: {filename}")
+        except IOError as e:
+            print(f"Error updating test file: {e}")
+
+    @staticmethod
+    def run_demo():
+        # Создаем тестовый файл
+        test_file = "numbers.txt"
+        NumberDataApplication.create_test_file(test_file)
+
+        # Создаем источник данных через фабрику
+        data_source = DataSourceFactory.create_file_data_source(test_file)
+        service = NumberOperationsService(data_source)
+
+        print("=== Первый доступ к данным ===")
+        results = service.perform_all_operations()
+        NumberDataApplication.print_results(results)
+
+        # Ждем немного и обновляем файл
+        print("\nОжидание 2 секунды перед обновлением файла...")
+        time.sleep(2)
+
+        NumberDataApplication.update_test_file(test_file)
+        print("Файл обновлен, ожидание обнаружения изменений...")
+
+        # Ждем еще немного для обнаружения изменений
+        time.sleep(1)
+
+        print("\n=== Второй доступ к данным (после обновления) ===")
+        results = service.perform_all_operations()
+        NumberDataApplication.print_results(results)
+
+        # Еще один доступ для демонстрации
+        print("\n=== Третий доступ к данным ===")
+        results = service.perform_all_operations()
+        NumberDataApplication.print_results(results)
+
+        print(f"\nЛог операций записан в файл: {Logger().log_file}")
+
+    @staticmethod
+    def print_results(results: dict):
+        print(f"Числа: {list(results['numbers'])}")
+        print(f"Сумма: {results['sum']}")
+        print(f"Максимум: {results['max']}")
+        print(f"Минимум: {results['min']}")
+        print(f"Среднее: {results['average']:.2f}")
+        print(f"Количество: {results['count']}")
+
+# Наблюдатель за файлом: inotify на Linux, опрос os.stat в остальных случаях
+class FileWatcher:
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+                  | IN_DELETE_SELF | IN_MOVE_SELF)
+    # Каталог удалён или перемещён - наблюдение за ним больше не работает
+    WATCH_LOST_MASK = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, file_path: str, on_change: Callable[[], None], poll_interval: float = 1.0):
+        self.file_path = os.path.abspath(file_path)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.backend = 'polling'
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify_fd: Optional[int] = None
+        self._wakeup_pipe: Optional[Tuple[int, int]] = None
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        self._inotify_fd = self._open_inotify()
+        if self._inotify_fd is not None:
+            self.backend = 'inotify'
+            self._wakeup_pipe = os.pipe()
+            target = self._watch_inotify
+        else:
+            self.backend = 'polling'
+            target = self._watch_polling
+        self._thread = threading.Thread(target=target, name="FileWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._wakeup_pipe is not None:
+            os.write(self._wakeup_pipe[1], b'\0')
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._inotify_fd, *(self._wakeup_pipe or ())):
+            if fd is not None:
+                os.close(fd)
+        self._inotify_fd = None
+        self._wakeup_pipe = None
+
+    def _open_inotify(self) -> Optional[int]:
+        if not sys.platform.startswith('linux'):
+            return None
+        import ctypes
+        import ctypes.util
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+            if fd < 0:
+                return None
+            # Следим за каталогом, чтобы заметить ротацию и пересоздание файла
+            directory = os.path.dirname(self.file_path).encode()
+            if libc.inotify_add_watch(fd, directory, self.WATCH_MASK) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _watch_inotify(self) -> None:
+        file_name = os.path.basename(self.file_path).encode()
+        wakeup_fd = self._wakeup_pipe[0]
+        while not self._stop_event.is_set():
+            ready, _, _ = select.select([self._inotify_fd, wakeup_fd], [], [])
+            if self._inotify_fd not in ready:
+                continue
+            try:
+                data = os.read(self._inotify_fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+
+            changed, lost = self._parse_events(data, file_name)
+            if changed:
+                self._notify()
+            if lost:
+                # Следить больше не за чем: файл мог появиться в другом месте или в новом каталоге
+                self.backend = 'polling'
+                self._watch_polling()
+                return
+
+    def _parse_events(self, data: bytes, file_name: bytes) -> Tuple[bool, bool]:
+        """(изменился ли файл, потеряно ли наблюдение за каталогом) для пачки событий inotify.
+        Несколько событий за одно чтение схлопываются в один вызов on_change; переполнение
+        очереди событий и потеря наблюдения тоже считаются изменением - события могли пропасть"""
+        changed = lost = False
+        position = 0
+        while position < len(data):
+            _, mask, _, name_length = self.EVENT_HEADER.unpack_from(data, position)
+            position += self.EVENT_HEADER.size
+            name = data[position:position + name_length].rstrip(b'\0')
+            position += name_length
+            lost = lost or bool(mask & self.WATCH_LOST_MASK)
+            changed = changed or name == file_name or bool(mask & (self.IN_Q_OVERFLOW | self.WATCH_LOST_MASK))
+        return changed, lost
+
+    def _watch_polling(self) -> None:
+        signature = self._stat_signature()
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._stat_signature()
+            if current != signature:
+                signature = current
+                self._notify()
+
+    def _stat_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except OSError:
+            return None
+
+    def _notify(self) -> None:
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"Error handling file change: {e}")
+
+# Дополнительный класс для мониторинга изменений
+class DataMonitor:
+    def __init__(self, data_source: NumberDataSource, check_interval: int = 5,
+                 file_path: Optional[str] = None):
+        self.data_source = data_source
+        self.check_interval = check_interval
+        self.file_path = file_path or self._find_file_path(data_source)
+        self.logger = Logger()
+        self.running = False
+        self.callbacks: List[Callable[[NumberDataSource], None]] = []
+        self._watcher: Optional[FileWatcher] = None
+
+    @staticmethod
+    def _find_file_path(data_source: NumberDataSource) -> str:
+        while isinstance(data_source, LoggingNumberDataSourceProxy):
+            data_source = data_source.real_data_source
+        file_path = getattr(data_source, 'file_path', None)
+        if file_path is None:
+            raise ValueError("file_path is required for data sources without a file")
+        return file_path
+
+    def add_callback(self, callback: Callable[[NumberDataSource], None]) -> None:
+        """Колбэк вызывается из фонового потока после перезагрузки данных"""
+        self.callbacks.append(callback)
+
+    def start(self) -> None:
+        """Запускает наблюдение за файлом в фоновом потоке и сразу возвращает управление"""
+        if self.running:
+            return
+        self.running = True
+        self._watcher = FileWatcher(self.file_path, self._on_file_changed, self.check_interval)
+        self._watcher.start()
+        self.logger.log(f"Data monitoring started ({self._watcher.backend})")
+
+    def start_monitoring(self):
+        """Запускает мониторинг изменений и блокирует поток до остановки"""
+        self.start()
+        try:
+            while self.running:
+                time.sleep(self.check_interval)
+        except KeyboardInterrupt:
+            self.stop_monitoring()
+
+    def stop_monitoring(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+            self.logger.log("Data monitoring stopped")
+        self.running = False
+
+    def _on_file_changed(self) -> None:
+        self.data_source.invalidate()
+        self.data_source.check_for_updates()
+        for callback in self.callbacks:
+            callback(self.data_source)
+
+# Пример использования
+def run_data_example():
+    # Создание файла с данными
+    with open("data.txt", "w") as f:
+        f.write("1\n2\n3\n4\n5\n")
+
+    # Создание источника данных
+    data_source = DataSourceFactory.create_file_data_source("data.txt")
+    service = NumberOperationsService(data_source)
+
+    # Выполнение операций
+    print("Sum:", service.get_sum())
+    print("Max:", service.get_max())
+    print("Average:", service.get_average())
+
+    # Можно также использовать монитор
+    monitor = DataMonitor(data_source, check_interval=3)
+    # monitor.start_monitoring() # Раскомментировать для запуска мониторинга
+    return monitor
@@ -0,0 +1,365 @@
+# Задание 2. Создайте приложение для приготовления пасты.
+# Приложение должно уметь создавать минимум три вида пасты.
+# Классы различной пасты должны иметь следующие методы:
+# ■ Тип пасты;
+# ■ Соус;
+# ■ Начинка;
+# ■ Добавки.
+# Для реализации используйте порождающие паттерны.
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any
+from enum import Enum
+
+
+# Паттерн: Factory Method
+class PastaType(Enum):
+    CARBONARA = "Карбонара"
+    BOLOGNESE = "Болоньезе"
+    ALFREDO = "Альфредо"
+    MARINARA = "Маринара"
+
+
+class Pasta(ABC):
+    """Абстрактный класс пасты"""
+
+    def __init__(self):
+        self._type: str = ""
+        self._sauce: str = ""
+        self._filling: str = ""
+        self._additives: List[str] = []
+        self._pasta_type: str = "спагетти"  # тип макарон
+
+    @abstractmethod
+    def get_type(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_sauce(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_filling(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_additives(self) -> List[str]:
+        pass
+
+    def set_pasta_type(self, pasta_type: str) -> None:
+        self._pasta_type = pasta_type
+
+    def get_pasta_type(self) -> str:
+        return self._pasta_type
+
+    def __str__(self) -> str:
+        return (f"Паста: {self.get_type()}\n"
+                f"Тип макарон: {self.get_pasta_type()}\n"
+                f"Соус: {self.get_sauce()}\n"
+                f"Начинка: {self.get_filling()}\n"
+                f"Добавки: {', '.join(self.get_additives()) if self.get_additives() else 'нет'}\n"
+                f"---")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.get_type(),
+            'pasta_type': self.get_pasta_type(),
+            'sauce': self.get_sauce(),
+            'filling': self.get_filling(),
+            'additives': self.get_additives()
+        }
+
+
+# Конкретные классы пасты
+class CarbonaraPasta(Pasta):
+    def get_type(self) -> str:
+        return "Карбонара"
+
+    def get_sauce(self) -> str:
+        return "Сырно-яичный соус с гуанчиале"
+
+    def get_filling(self) -> str:
+        return "Гуанчиале, яичные желтки, пармезан"
+
+    def get_additives(self) -> List[str]:
+        return ["Черный перец", "Соль", "Оливковое масло"]
+
+
+class BolognesePasta(Pasta):
+    def get_type(self) -> str:
+        return "Болоньезе"
+
+    def get_sauce(self) -> str:
+        return "Томатный соус с мясом"
+
+    def get_filling(self) -> str:
+        return "Говяжий фарш, свиной фарш, овощи"
+
+    def get_additives(self) -> List[str]:
+        return ["Базилик", "Чеснок", "Лук", "Морковь", "Сельдерей"]
+
+
+class AlfredoPasta(Pasta):
+    def get_type(self) -> str:
+        return "Альфредо"
+
+    def get_sauce(self) -> str:
+        return "Сливочный соус с пармезаном"
+
+    def get_filling(self) -> str:
+        return "Курица, грибы"
+
+    def get_additives(self) -> List[str]:
+        return ["Пармезан", "Сливочное масло", "Чеснок", "Петрушка"]
+
+
+class MarinaraPasta(Pasta):
+    def get_type(self) -> str:
+        return "Маринара"
+
+    def get_sauce(self) -> str:
+        return "Томатный соус с травами"
+
+    def get_filling(self) -> str:
+        return "Морепродукты (креветки, мидии, кальмары)"
+
+    def get_additives(self) -> List[str]:
+        return ["Чеснок", "Базилик", "Орегано", "Белое вино"]
+
+
+# Паттерн: Factory Method
+class PastaFactory(ABC):
+    """Фабрика для создания пасты"""
+
+    @abstractmethod
+    def create_pasta(self) -> Pasta:
+        pass
+
+    def prepare_pasta(self) -> Pasta:
+        pasta = self.create_pasta()
+        print(f"Готовим {pasta.get_type()}...")
+        return pasta
+
+
+class CarbonaraFactory(PastaFactory):
+    def create_pasta(self) -> Pasta:
+        return CarbonaraPasta()
+
+
+class BologneseFactory(PastaFactory):
+    def create_pasta(self) -> Pasta:
+        return BolognesePasta()
+
+
+class AlfredoFactory(PastaFactory):
+    def create_pasta(self) -> Pasta:
+        return AlfredoPasta()
+
+
+class MarinaraFactory(PastaFactory):
+    def create_pasta(self) -> Pasta:
+        return MarinaraPasta()
+
+
+# Паттерн: Builder
+class PastaBuilder:
+    """Строитель для кастомной пасты"""
+
+    def __init__(self):
+        self.pasta = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.pasta = CustomPasta()
+
+    def set_type(self, pasta_type: str) -> 'PastaBuilder':
+        self.pasta._type = pasta_type
+        return self
+
+    def set_sauce(self, sauce: str) -> 'PastaBuilder':
+        self.pasta._sauce = sauce
+        return self
+
+    def set_filling(self, filling: str) -> 'PastaBuilder':
+        self.pasta._filling = filling
+        return self
+
+    def set_pasta_type(self, pasta_type: str) -> 'PastaBuilder':
+        self.pasta.set_pasta_type(pasta_type)
+        return self
+
+    def add_additive(self, additive: str) -> 'PastaBuilder':
+        self.pasta._additives.append(additive)
+        return self
+
+    def build(self) -> Pasta:
+        pasta = self.pasta
+        self.reset()
+        return pasta
+
+
+class CustomPasta(Pasta):
+    """Кастомная паста, создаваемая через Builder"""
+
+    def get_type(self) -> str:
+        return self._type or "Кастомная паста"
+
+    def get_sauce(self) -> str:
+        return self._sauce or "Без соуса"
+
+    def get_filling(self) -> str:
+        return self._filling or "Без начинки"
+
+    def get_additives(self) -> List[str]:
+        return self._additives
+
+
+# Паттерн: Singleton для меню пасты
+class PastaMenu:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._menu = {
+                PastaType.CARBONARA: CarbonaraFactory(),
+                PastaType.BOLOGNESE: BologneseFactory(),
+                PastaType.ALFREDO: AlfredoFactory(),
+                PastaType.MARINARA: MarinaraFactory()
+            }
+        return cls._instance
+
+    def get_factory(self, pasta_type: PastaType) -> PastaFactory:
+        return self._menu[pasta_type]
+
+    def get_available_types(self) -> List[PastaType]:
+        return list(self._menu.keys())
+
+
+# Приложение для приготовления пасты
+class PastaCookingApp:
+    def __init__(self):
+        self.menu = PastaMenu()
+        self.builder = PastaBuilder()
+
+    def show_menu(self) -> None:
+        print("🍝 МЕНЮ ПАСТЫ 🍝")
+        print("=" * 30)
+        for i, pasta_type in enumerate(self.menu.get_available_types(), 1):
+            print(f"{i}. {pasta_type.value}")
+        print("5. Создать кастомную пасту")
+        print("=" * 30)
+
+    def cook_standard_pasta(self, choice: int) -> Pasta:
+        types = self.menu.get_available_types()
+        if 1 <= choice <= len(types):
+            pasta_type = types[choice - 1]
+            factory = self.menu.get_factory(pasta_type)
+            return factory.prepare_pasta()
+        else:
+            raise ValueError("Неверный выбор")
+
+    def cook_custom_pasta(self) -> Pasta:
+        print("\nСоздание кастомной пасты:")
+        print("Выберите тип макарон:")
+        pasta_types = ["спагетти", "феттучини", "пенне", "фарфалле", "равиоли"]
+        for i, pt in enumerate(pasta_types, 1):
+            print(f"{i}. {pt}")
+
+        choice = int(input("Ваш выбор: "))
+        pasta_type = pasta_types[choice - 1] if 1 <= choice <= len(pasta_types) else "спагетти"
+
+        print("\nВведите тип пасты (например: 'Моя особенная паста'):")
+        type_name = input("Тип: ") or "Кастомная паста"
+
+        print("\nВведите соус:")
+        sauce = input("Соус: ") or "Стандартный соус"
+
+        print("\nВведите начинку:")
+        filling = input("Начинка: ") or "Стандартная начинка"
+
+        print("\nДобавьте добавки (через запятую):")
+        additives_input = input("Добавки: ") or ""
+        additives = [additive.strip() for additive in additives_input.split(",") if additive.strip()]
+
+        custom_pasta = (self.builder
+                        .set_type(type_name)
+                        .set_sauce(sauce)
+                        .set_filling(filling)
+                        .set_pasta_type(pasta_type)
+                        .build())
+
+        for additive in additives:
+            custom_pasta._additives.append(additive)
+
+        print("Кастомная паста создана!")
+        return custom_pasta
+
+    def run(self) -> None:
+        print("Добро пожаловать в приложение для приготовления пасты!")
+
+        while True:
+            print("\n" + "=" * 40)
+            self.show_menu()
+
+            try:
+                choice = int(input("\nВыберите вариант (0 для выхода): "))
+
+                if choice == 0:
+                    print("До свидания! Приятного аппетита! 🍝")
+                    break
+                elif 1 <= choice <= 4:
+                    pasta = self.cook_standard_pasta(choice)
+                    print("\nВаша паста готова!")
+                    print(pasta)
+                elif choice == 5:
+                    pasta = self.cook_custom_pasta()
+                    print("\nВаша кастомная паста готова!")
+                    print(pasta)
+                else:
+                    print("Неверный выбор. Попробуйте снова.")
+
+            except ValueError:
+                print("Пожалуйста, введите число.")
+            except Exception as e:
+                print(f"Произошла ошибка: {e}")
+
+
+# Демонстрация работы приложения
+def demonstrate_pasta_patterns():
+    print("=== Демонстрация паттернов проектирования ===\n")
+
+    # 1. Factory Method
+    print("1. Factory Method:")
+    factories = [CarbonaraFactory(), BologneseFactory(), AlfredoFactory()]
+
+    for factory in factories:
+        pasta = factory.create_pasta()
+        print(f"Фабрика создала: {pasta.get_type()}")
+        print(f"Соус: {pasta.get_sauce()}")
+        print(f"Начинка: {pasta.get_filling()}")
+        print(f"Добавки: {', '.join(pasta.get_additives())}")
+        print()
+
+    # 2. Builder
+    print("2. Builder Pattern:")
+    builder = PastaBuilder()
+    custom_pasta = (builder
+                    .set_type("Экспериментальная паста")
+                    .set_sauce("Трюфельный соус")
+                    .set_filling("Утка конфи, грибы")
+                    .set_pasta_type("феттучини")
+                    .add_additive("Трюфельное масло")
+                    .add_additive("Пармезан")
+                    .add_additive("Зеленый лук")
+                    .build())
+
+    print(custom_pasta)
+
+    # 3. Singleton
+    print("3. Singleton Pattern:")
+    menu1 = PastaMenu()
+    menu2 = PastaMenu()
+    print(f"menu1 is menu2: {menu1 is menu2}")
+    print(f"Доступные типы: {[t.value for t in menu1.get_available_types()]}")
+    print()
@@ -0,0 +1,301 @@
+# Задание 3. Создайте реализацию паттерна Prototype. Протестируйте работу созданного класса.
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any
+import copy
+
+class Prototype(ABC):
+    """Абстрактный класс прототипа"""
+
+    @abstractmethod
+    def clone(self):
+        pass
+
+    @abstractmethod
+    def deep_clone(self):
+        pass
+
+
+class Person(Prototype):
+    """Класс Person, реализующий паттерн Prototype"""
+
+    def __init__(self, name: str, age: int, hobbies: List[str] = None, metadata: Dict[str, Any] = None):
+        self.name = name
+        self.age = age
+        self.hobbies = hobbies if hobbies else []
+        self.metadata = metadata if metadata else {}
+        self._internal_data = {"created_at": "2024-01-01"}  # внутренние данные
+
+    def clone(self):
+        """Поверхностное копирование"""
+        return copy.copy(self)
+
+    def deep_clone(self):
+        """Глубокое копирование"""
+        return copy.deepcopy(self)
+
+    def custom_clone(self, **kwargs):
+        """Кастомное клонирование с возможностью изменения атрибутов"""
+        cloned = self.deep_clone()
+        for key, value in kwargs.items():
+            if hasattr(cloned, key):
+                setattr(cloned, key, value)
+        return cloned
+
+    def add_hobby(self, hobby: str):
+        self.hobbies.append(hobby)
+
+    def update_metadata(self, key: str, value: Any):
+        self.metadata[key] = value
+
+    def __str__(self):
+        return (f"Person(name='{self.name}', age={self.age}, "
+                f"hobbies={self.hobbies}, metadata={self.metadata})")
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'age': self.age,
+            'hobbies': self.hobbies.copy(),
+            'metadata': self.metadata.copy()
+        }
+
+    def to_json(self):
+        import json
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+
+class Employee(Person):
+    """Наследник Person с дополнительными атрибутами"""
+
+    def __init__(self, name: str, age: int, position: str, salary: float, **kwargs):
+        super().__init__(name, age, **kwargs)
+        self.position = position
+        self.salary = salary
+        self.skills = []
+
+    def clone(self):
+        return copy.copy(self)
+
+    def deep_clone(self):
+        return copy.deepcopy(self)
+
+    def add_skill(self, skill: str):
+        self.skills.append(skill)
+
+    def __str__(self):
+        base_str = super().__str__()
+        return (f"Employee({base_str[7:-1]}, "
+                f"position='{self.position}', salary={self.salary}, "
+                f"skills={self.skills})")
+
+    def to_dict(self):
+        data = super().to_dict()
+        data.update({
+            'position': self.position,
+            'salary': self.salary,
+            'skills': self.skills.copy()
+        })
+        return data
+
+
+class PrototypeRegistry:
+    """Реестр прототипов (паттерн Registry)"""
+
+    def __init__(self):
+        self._prototypes: Dict[str, Prototype] = {}
+
+    def register_prototype(self, key: str, prototype: Prototype):
+        self._prototypes[key] = prototype
+
+    def unregister_prototype(self, key: str):
+        if key in self._prototypes:
+            del self._prototypes[key]
+
+    def get_prototype(self, key: str) -> Prototype:
+        if key not in self._prototypes:
+            raise ValueError(f"Прототип с ключом '{key}' не найден")
+        return self._prototypes[key].clone()
+
+    def get_deep_prototype(self, key: str) -> Prototype:
+        if key not in self._prototypes:
+            raise ValueError(f"Прототип с ключом '{key}' не найден")
+        return self._prototypes[key].deep_clone()
+
+    def list_prototypes(self) -> List[str]:
+        return list(self._prototypes.keys())
+
+
+# Тестирование паттерна Prototype
+def test_prototype_pattern():
+    print("=== Тестирование паттерна Prototype ===\n")
+
+    # Создание оригинального объекта
+    print("1. Создание оригинального объекта:")
+    original_person = Person(
+        name="Иван Иванов",
+        age=30,
+        hobbies=["чтение", "программирование"],
+        metadata={"department": "IT", "level": "senior"}
+    )
+    print(f"Оригинал: {original_person}")
+    print(f"ID оригинала: {id(original_person)}")
+    print(f"ID hobbies: {id(original_person.hobbies)}")
+    print()
+
+    # Поверхностное копирование
+    print("2. Поверхностное копирование (shallow copy):")
+    shallow_copy = original_person.clone()
+    print(f"Копия: {shallow_copy}")
+    print(f"ID копии: {id(shallow_copy)}")
+    print(f"ID hobbies копии: {id(shallow_copy.hobbies)}")
+    print("Списки hobbies разделяются (same ID):", id(original_person.hobbies) == id(shallow_copy.hobbies))
+    print()
+
+    # Глубокое копирование
+    print("3. Глубокое копирование (deep copy):")
+    deep_copy = original_person.deep_clone()
+    print(f"Глубокая копия: {deep_copy}")
+    print(f"ID глубокой копии: {id(deep_copy)}")
+    print(f"ID hobbies глубокой копии: {id(deep_copy.hobbies)}")
+    print("Списки hobbies разные (different ID):", id(original_person.hobbies) != id(deep_copy.hobbies))
+    print()
+
+    # Изменение оригинального объекта
+    print("4. Изменение оригинального объекта:")
+    original_person.add_hobby("путешествия")
+    original_person.update_metadata("level", "lead")
+    print(f"Оригинал после изменений: {original_person}")
+    print(f"Поверхностная копия после изменений оригинала: {shallow_copy}")
+    print(f"Глубокая копия после изменений оригинала: {deep_copy}")
+    print()
+
+    # Кастомное клонирование
+    print("5. Кастомное клонирование:")
+    custom_clone = original_person.custom_clone(name="Петр Петров", age=25)
+    print(f"Кастомная копия: {custom_clone}")
+    print()
+
+    # Тестирование наследования
+    print("6. Тестирование наследования:")
+    original_employee = Employee(
+        name="Анна Сидорова",
+        age=28,
+        position="Разработчик",
+        salary=100000,
+        hobbies=["йога", "рисование"],
+        metadata={"team": "backend"}
+    )
+    original_employee.add_skill("Python")
+    original_employee.add_skill("Django")
+
+    employee_copy = original_employee.deep_clone()
+    print(f"Оригинальный сотрудник: {original_employee}")
+    print(f"Копия сотрудника: {employee_copy}")
+    print()
+
+    # Изменение копии сотрудника
+    employee_copy.add_skill("JavaScript")
+    employee_copy.salary = 120000
+    print("После изменения копии:")
+    print(f"Оригинальный сотрудник: {original_employee}")
+    print(f"Копия сотрудника: {employee_copy}")
+    print()
+
+    # Тестирование реестра прототипов
+    print("7. Тестирование реестра прототипов:")
+    registry = PrototypeRegistry()
+
+    # Регистрация прототипов
+    registry.register_prototype("default_person", Person("Default", 0))
+    registry.register_prototype("senior_dev", original_person)
+    registry.register_prototype("backend_dev", original_employee)
+
+    print("Зарегистрированные прототипы:", registry.list_prototypes())
+
+    # Получение прототипов из реестра
+    default_person = registry.get_deep_prototype("default_person")
+    senior_dev_copy = registry.get_deep_prototype("senior_dev")
+
+    print(f"Прототип по умолчанию: {default_person}")
+    print(f"Копия senior разработчика: {senior_dev_copy}")
+    print()
+
+    # JSON представление
+    print("8. JSON представление объектов:")
+    print("Оригинальный person JSON:")
+    print(original_person.to_json())
+    print("\nОригинальный employee JSON:")
+    print(original_employee.to_json())
+
+
+def additional_tests():
+    print("\n=== Дополнительные тесты ===\n")
+
+    # Тест вложенных объектов
+    print("1. Тест с вложенными объектами:")
+    complex_person = Person(
+        name="Тестовый",
+        age=99,
+        hobbies=["сложное", "хобби"],
+        metadata={
+            "nested": {
+                "level1": {
+                    "level2": "глубокое значение"
+                }
+            },
+            "list": [1, 2, 3, [4, 5]]
+        }
+    )
+
+    complex_copy = complex_person.deep_clone()
+
+    # Изменяем глубоко вложенные данные
+    complex_person.metadata["nested"]["level1"]["level2"] = "измененное значение"
+    complex_person.metadata["list"][3].append(6)
+
+    print("Оригинал после глубоких изменений:")
+    print(complex_person.metadata)
+    print("Копия после глубоких изменений оригинала:")
+    print(complex_copy.metadata)
+    print("Разные объекты:", complex_person.metadata is not complex_copy.metadata)
+    print()
+
+    # Тест производительности
+    print("2. Тест производительности (клонирование 1000 объектов):")
+    import time
+
+    test_person = Person("Test", 25, ["hobby1", "hobby2"])
+
+    # Поверхностное копирование
+    start_time = time.time()
+    for _ in range(1000):
+        test_person.clone()
+    shallow_time = time.time() - start_time
+
+    # Глубокое копирование
+    start_time = time.time()
+    for _ in range(1000):
+        test_person.deep_clone()
+    deep_time = time.time() - start_time
+
+    print(f"Время 1000 поверхностных копий: {shallow_time:.4f} сек")
+    print(f"Время 1000 глубоких копий: {deep_time:.4f} сек")
+    print(f"Разница: {deep_time / shallow_time:.2f}x")
+    print()
+
+    # Тест исключений
+    print("3. Тест обработки исключений:")
+    registry = PrototypeRegistry()
+
+    try:
+        registry.get_prototype("nonexistent")
+    except ValueError as e:
+        print(f"Ожидаемая ошибка: {e}")
+
+    # Тест с пустыми данными
+    empty_person = Person("", 0, [], {})
+    empty_copy = empty_person.deep_clone()
+    print(f"Пустой оригинал: {empty_person}")
+    print(f"Пустая копия: {empty_copy}")
+    print("Разные объекты:", empty_person is not empty_copy)
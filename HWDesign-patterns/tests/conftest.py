@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def work_dir(tmp_path, monkeypatch):
+    # Модули пишут логи и файлы состояния в текущий каталог
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,15 @@
+import json
+
+import benchmark_numbers
+
+
+def test_benchmark_run_writes_results_and_compares_with_itself(work_dir, capsys):
+    assert benchmark_numbers.main(['--sizes', '200', '--repeat', '1', '--workdir', 'work',
+                                   '--output', 'bench.json']) == 0
+    with open('bench.json', encoding='utf-8') as file:
+        results = json.load(file)['results']
+
+    assert results and {item['size'] for item in results} == {200}
+    assert all(item['median_s'] >= 0 for item in results)
+    assert benchmark_numbers.compare_with_baseline(results, 'bench.json', tolerance=0.0) == 0
+    assert list((work_dir / 'work').glob('numbers_*.txt')) == []
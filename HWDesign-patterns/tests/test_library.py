@@ -0,0 +1,375 @@
+import csv
+import gc
+import io
+import json
+import pickle
+import weakref
+
+import pytest
+
+from patterns.library import (EXPORT_BATCH_ROWS, BinarySnapshot, Book, BookRepository, BookSearchIndex, BookStatus,
+                              ColumnarExportStrategy, CSVExportStrategy, JSONExportStrategy, JSONStreamReader,
+                              Librarian, LibrarianRepository, LibraryFacade, PickleExportStrategy, Reader,
+                              ReaderRepository, Repository, WriteAheadLog, read_columnar)
+
+
+def make_facade(state_path='library_state.json'):
+    facade = LibraryFacade()
+    facade.observers = []
+    facade.state_path = state_path
+    return facade
+
+
+def make_books(titles):
+    return [Book(book_id, title, 'Автор', 2000, f'isbn-{book_id}')
+            for book_id, title in enumerate(titles, start=1)]
+
+
+def fill_library(facade):
+    books = [facade.add_book(f'Книга {number}', f'Автор {number % 3}', 1900 + number % 7, f'isbn-{number}')
+             for number in range(20)]
+    readers = [facade.add_reader('Иван Иванов', 'ivan@mail.com', '+7-999'),
+               facade.add_reader('Пётр Петров', 'petr@mail.com', '+7-998')]
+    facade.add_librarian('Анна Сидорова', 'anna@library.ru', '+7-495', 'Главный библиотекарь')
+    facade.borrow_book(readers[0].id, books[3].id)
+    facade.delete_book(books[5].id)
+    return books, readers
+
+
+def library_state(facade):
+    return ([book.to_dict() for book in facade.book_repo.get_all()],
+            [librarian.to_dict() for librarian in facade.librarian_repo.get_all()],
+            [reader.to_dict() for reader in facade.reader_repo.get_all()])
+
+
+@pytest.mark.parametrize('repository_class, make_entity', [
+    (LibrarianRepository, lambda name: Librarian(0, name, f'{name}@library.ru', '+7-495', 'Библиотекарь')),
+    (ReaderRepository, lambda name: Reader(0, name, f'{name}@mail.com', '+7-999', [])),
+])
+def test_generic_repositories_share_one_storage_engine(repository_class, make_entity):
+    repository = repository_class()
+    first, second = make_entity('анна'), make_entity('борис')
+    repository.add(first)
+    repository.add(second)
+
+    assert isinstance(repository, Repository)
+    assert not hasattr(first, '__dict__')
+    assert (first.id, second.id) == (1, 2)
+    assert repository.search(email=second.email) == [second]
+    second.name = 'вера'
+    repository.update(second)
+    assert repository.search(name='вера') == [second] and repository.search(name='борис') == []
+    assert repository.query(order_by='name', descending=True).items == [second, first]
+    repository.delete(first.id)
+    assert repository.get_all() == [second] and repository.search(name='анна') == []
+
+
+def test_hash_index_search_follows_updates():
+    facade = make_facade()
+    books, _ = fill_library(facade)
+    book = books[0]
+    book.author = 'Новый Автор'
+    facade.update_book(book)
+
+    assert facade.search_books(author='Новый Автор') == [book]
+    assert book not in facade.search_books(author='Автор 0')
+    assert facade.search_books(author='Автор 1', year=1901) == [books[1]]
+    assert facade.search_books(status=BookStatus.BORROWED) == [books[3]]
+
+
+@pytest.mark.parametrize('order_by', ['id', 'year', 'title'])
+@pytest.mark.parametrize('descending', [False, True])
+def test_query_pages_cover_range_in_order(order_by, descending):
+    facade = make_facade()
+    fill_library(facade)
+    expected = sorted((book for book in facade.book_repo.get_all() if 1901 <= book.year <= 1905),
+                      key=lambda book: (getattr(book, order_by), book.id), reverse=descending)
+
+    pages = []
+    cursor = None
+    while True:
+        page = facade.query_books(order_by, year_from=1901, year_to=1905, descending=descending,
+                                  limit=4, cursor=cursor)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [book for items in pages for book in items] == expected
+    assert all(len(items) == 4 for items in pages[:-1])
+
+
+@pytest.mark.parametrize('state_path', ['library_state.json', 'library_state.snap'])
+def test_state_roundtrip(work_dir, state_path):
+    facade = make_facade(state_path)
+    fill_library(facade)
+    facade.compress_snapshot = True
+    facade.save_state()
+    progress = []
+
+    restored = make_facade(state_path)
+    restored.load_state(batch_size=4, progress=lambda loaded, _: progress.append(loaded))
+
+    assert library_state(restored) == library_state(facade)
+    assert progress and progress[-1] == 22
+    assert restored.search_books_text('книга 1')[0].title == 'Книга 1'
+    assert restored.add_book('Новая', 'Автор', 2000, 'isbn-new').id == 21
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_binary_snapshot_reads_records_lazily(work_dir, compress):
+    facade = make_facade('library_state.snap')
+    books, readers = fill_library(facade)
+    facade.compress_snapshot = compress
+    facade.save_state()
+
+    with BinarySnapshot('library_state.snap') as snapshot:
+        table = snapshot.tables['books']
+        assert len(table) == 19
+        assert table[-1].to_dict() == books[-1].to_dict()
+        assert table[3].to_dict() == books[3].to_dict()
+        assert snapshot.tables['readers'][0].books_borrowed == readers[0].books_borrowed
+
+
+def test_snapshot_rejects_foreign_files(work_dir):
+    (work_dir / 'library_state.snap').write_bytes(b'not a snapshot at all')
+
+    with pytest.raises(ValueError):
+        BinarySnapshot('library_state.snap')
+
+
+@pytest.mark.parametrize('filename', ['books.json', 'books.ndjson'])
+def test_import_books_streams_json_and_ndjson(work_dir, filename):
+    books = [Book(number, f'Книга {number}', 'Автор', 2000, f'isbn-{number}').to_dict()
+             for number in range(1, 8)]
+    JSONExportStrategy().export(iter(books), filename)
+    facade = make_facade()
+
+    facade.import_books_from_json(filename, batch_size=3)
+
+    assert [book.to_dict() for book in facade.book_repo.get_all()] == books
+
+
+def test_json_and_csv_exports_stream_rows(work_dir):
+    rows = [{'id': number, 'title': f'Книга "{number}"', 'borrower_id': None}
+            for number in range(2 * EXPORT_BATCH_ROWS + 5)]
+
+    assert JSONExportStrategy().export(iter(rows), 'rows.json') == len(rows)
+    assert JSONExportStrategy().export(iter([]), 'empty.json') == 0
+    assert CSVExportStrategy().export(iter(rows), 'rows.csv') == len(rows)
+
+    with open('rows.json', encoding='utf-8') as f:
+        assert f.read() == json.dumps(rows, indent=2, ensure_ascii=False)
+    with open('empty.json', encoding='utf-8') as f:
+        assert json.load(f) == []
+    with open('rows.csv', encoding='utf-8', newline='') as f:
+        assert [row['title'] for row in csv.DictReader(f)] == [row['title'] for row in rows]
+    assert CSVExportStrategy().export(iter([]), 'empty.csv') == 0
+    assert not (work_dir / 'empty.csv').exists()
+
+
+def test_prefix_search_keeps_rare_terms_past_the_start_of_the_range():
+    index = BookSearchIndex()
+    # 600 частых слов с префиксом 'ка' сортируются раньше редкого 'каяк'
+    titles = [f'ка{number:04d}' for number in range(600)]
+    titles.append('каяк')
+    for book in make_books(titles):
+        index.add(book, defer=True)
+
+    found = [book_id for book_id, _ in index.search('ка', limit=len(titles))]
+
+    assert len(found) == len(titles)
+    assert len(titles) in found
+
+
+def test_complete_orders_whole_prefix_range_by_frequency():
+    repository = BookRepository()
+    titles = [f'слово{number:04d}' for number in range(600)] + ['слоняра'] * 3
+    repository.restore_many(make_books(titles))
+
+    assert repository.text_index.complete('сло', limit=1) == ['слоняра']
+    assert [book.title for book in repository.full_text_search('слон')] == ['слоняра'] * 3
+
+
+def test_sorted_index_batches_changes_until_read():
+    repository = BookRepository()
+    repository.restore_many(make_books([f'книга {number}' for number in range(100)]))
+    index = repository.sorted_indexes['title']
+    assert repository.query(order_by='title', limit=1).items[0].title == 'книга 0'
+    # Повторная загрузка тех же id не должна сливать индекс на каждой строке
+    repository.restore_many(make_books([f'том {number:03d}' for number in range(100)]))
+    assert len(index._pending) == 100 and len(index._removed) == 100
+
+    page = repository.query(order_by='title', limit=3)
+    assert [book.title for book in page.items] == ['том 000', 'том 001', 'том 002']
+    assert list(index.values) == sorted(index.values) and len(index.ids) == 100
+
+    book = repository.get(50)
+    book.title = 'аааа'
+    repository.update(book)
+    assert repository.query(order_by='title', limit=1).items == [book]
+    assert len(index.ids) == 100
+
+
+def test_update_of_missing_id_is_not_journaled(work_dir):
+    facade = make_facade()
+    facade.open_journal(sync=False)
+    facade.add_book('Война и мир', 'Лев Толстой', 1869, 'isbn-1')
+    facade.update_book(Book(42, 'Нет такой', 'Автор', 2000, 'isbn'))
+    facade.journal.close()
+
+    assert len((work_dir / 'library_state.wal').read_bytes().splitlines()) == 1
+    assert facade.journal.records == 1
+
+
+class ContractBookRepository(BookRepository):
+    def update(self, entity):
+        # Репозиторий по контракту Repository: update ничего не возвращает
+        super().update(entity)
+
+
+def test_updates_through_repositories_without_return_value_are_journaled(work_dir):
+    facade = make_facade()
+    facade.open_journal(sync=False)
+    facade.book_repo = ContractBookRepository()
+    book = facade.add_book('Черновик', 'Автор', 2000, 'isbn-1')
+    book.title = 'Чистовик'
+    facade.update_book(book)
+    facade.journal.close()
+
+    reopened = make_facade()
+    reopened.open_journal(sync=False)
+
+    assert [book.title for book in reopened.book_repo.get_all()] == ['Чистовик']
+
+
+def test_replay_drops_only_torn_tail(work_dir):
+    facade = make_facade()
+    facade.open_journal(sync=False)
+    facade.add_book('Война и мир', 'Лев Толстой', 1869, 'isbn-1')
+    facade.journal.close()
+    journal = work_dir / 'library_state.wal'
+    complete = journal.read_bytes()
+    journal.write_bytes(complete + b'{"op":"add_book","chan')
+
+    reopened = make_facade()
+    reopened.open_journal(sync=False)
+
+    assert [book.title for book in reopened.book_repo.get_all()] == ['Война и мир']
+    assert journal.read_bytes() == complete
+
+
+def test_replay_rejects_corrupted_record_in_the_middle(work_dir):
+    journal = work_dir / 'library_state.wal'
+    valid = b'{"op":"delete_book","changes":[["delete","books",1]]}\n'
+    content = valid + b'garbage\n' + valid
+    journal.write_bytes(content)
+    applied = []
+
+    with pytest.raises(ValueError, match='line 2'):
+        WriteAheadLog(str(journal)).replay(lambda *change: applied.append(change))
+
+    assert applied == [('delete', 'books', 1)]
+    assert journal.read_bytes() == content
+
+
+def test_corrupted_journal_leaves_state_and_journal_untouched(work_dir):
+    facade = make_facade()
+    facade.open_journal(sync=False)
+    facade.add_book('Первая', 'Автор', 2000, 'isbn-1')
+    facade.add_book('Третья', 'Автор', 2000, 'isbn-3')
+    facade.journal.close()
+    journal = work_dir / 'library_state.wal'
+    first, third = journal.read_bytes().splitlines(keepends=True)
+    journal.write_bytes(first + b'garbage\n' + third)
+
+    reopened = make_facade()
+    reopened.add_book('Своя', 'Автор', 1999, 'isbn-own')
+    before = library_state(reopened)
+    with pytest.raises(ValueError):
+        reopened.open_journal(sync=False)
+
+    assert reopened.journal is None
+    assert library_state(reopened) == before
+    reopened.add_book('Новая', 'Автор', 2001, 'isbn-new')
+    assert journal.read_bytes() == first + b'garbage\n' + third
+
+
+def test_journal_is_not_replayed_over_a_broken_snapshot(work_dir):
+    (work_dir / 'library_state.json').write_text('{"books": [{"id": 1, "title"', encoding='utf-8')
+    journal = work_dir / 'library_state.wal'
+    journal.write_bytes(b'{"op":"delete_book","changes":[["delete","books",1]]}\n')
+    facade = make_facade()
+
+    with pytest.raises(Exception):
+        facade.open_journal(sync=False)
+
+    assert facade.journal is None
+    assert journal.read_bytes() != b''
+
+
+class Row(dict):
+    pass
+
+
+def test_pickle_export_keeps_shared_references_and_frees_written_rows(work_dir):
+    shared = ['общий список']
+    recursive = Row(id=0)
+    recursive['self'] = recursive
+    alive_counts = []
+    written = []
+
+    def rows():
+        yield recursive
+        for number in range(1, 3 * EXPORT_BATCH_ROWS):
+            row = Row(id=number, status='available', first=shared, second=shared)
+            written.append(weakref.ref(row))
+            yield row
+            if number % EXPORT_BATCH_ROWS == EXPORT_BATCH_ROWS - 1:
+                gc.collect()
+                alive_counts.append(sum(ref() is not None for ref in written))
+
+    count = PickleExportStrategy().export(rows(), 'rows.pickle')
+    with open('rows.pickle', 'rb') as f:
+        loaded = pickle.load(f)
+
+    assert count == len(loaded) == 3 * EXPORT_BATCH_ROWS
+    assert loaded[0]['self'] is loaded[0]
+    assert all(row['first'] is row['second'] == shared for row in loaded[1:])
+    assert [row['id'] for row in loaded] == list(range(count))
+    # Мемо очищается между пачками: живы только строки текущей пачки
+    assert max(alive_counts) <= EXPORT_BATCH_ROWS + 1
+
+
+def columnar_rows():
+    # В первой группе строк столбец note пуст, тип становится известен только во второй
+    return [{'id': number, 'author': f'Автор {number % 3}', 'note': None if number < 4 else f'заметка {number}',
+             'borrowed': [number] * (number % 2), 'borrower_id': None}
+            for number in range(10)]
+
+
+@pytest.mark.parametrize('use_arrow', [False, True], ids=['builtin', 'parquet'])
+def test_columnar_roundtrip_types_columns_from_first_value(work_dir, use_arrow):
+    if use_arrow:
+        pytest.importorskip('pyarrow')
+    rows = columnar_rows()
+
+    count = ColumnarExportStrategy(row_group_size=4, use_arrow=use_arrow).export(iter(rows), 'rows.col')
+
+    assert count == len(rows)
+    columns = read_columnar('rows.col')
+    assert {name: columns[name] for name in rows[0]} == {name: [row[name] for row in rows] for name in rows[0]}
+    assert read_columnar('rows.col', ['note'])['note'] == [row['note'] for row in rows]
+
+
+@pytest.mark.parametrize('document, expected', [
+    ('{"books": [], "num": 1.25}', []),
+    ('{"books": [{"id": 0}], "n": 1e5}', [('books', {'id': 0})]),
+    ('{"n": -2.5E-3, "books": [1.5, 2e+2, -0.0, 7, "x"]}', [('books', 1.5), ('books', 200.0), ('books', -0.0),
+                                                          ('books', 7), ('books', 'x')]),
+])
+@pytest.mark.parametrize('chunk_size', [1, 2, 3])
+def test_json_stream_reader_reads_numbers_split_between_chunks(monkeypatch, document, expected, chunk_size):
+    monkeypatch.setattr(JSONStreamReader, 'CHUNK_SIZE', chunk_size)
+
+    assert list(JSONStreamReader(io.BytesIO(document.encode())).items()) == expected
@@ -0,0 +1,37 @@
+import asyncio
+import threading
+
+from patterns.number_async import AsyncNumberDataSource, AsyncNumberOperationsService
+from patterns.number_pipeline import FileNumberDataSource
+
+
+class CountingSource(FileNumberDataSource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.snapshot_calls = 0
+        self.release = threading.Event()
+
+    def get_snapshot(self):
+        self.snapshot_calls += 1
+        self.release.wait(5)
+        return super().get_snapshot()
+
+
+def test_concurrent_requests_share_one_snapshot_call(work_dir):
+    path = work_dir / 'numbers.txt'
+    path.write_text('3\n1\n2\n', encoding='utf-8')
+    source = CountingSource(str(path))
+    service = AsyncNumberOperationsService(AsyncNumberDataSource(source))
+
+    async def run():
+        requests = [asyncio.ensure_future(service.get_sum()) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        source.release.set()
+        return await asyncio.gather(*requests), await service.perform_all_operations()
+
+    sums, results = asyncio.run(run())
+
+    assert sums == [6] * 5
+    assert source.snapshot_calls == 2
+    assert (results['min'], results['max'], results['count']) == (1, 3, 3)
+    assert list(results['numbers']) == [3, 1, 2]
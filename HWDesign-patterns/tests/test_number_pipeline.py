@@ -0,0 +1,334 @@
+import glob
+import threading
+import time
+
+import pytest
+
+from patterns.number_pipeline import (DataSourceFactory, FileNumberDataSource, FileWatcher, Logger,
+                                      LoggingNumberDataSourceProxy, NumberOperationsService,
+                                      ShardedNumberDataSource, metrics)
+
+
+def write_numbers(path, numbers):
+    # Режим 'r+' с усечением сохраняет inode файла
+    with open(path, 'r+' if path.exists() else 'w', encoding='utf-8') as file:
+        file.truncate(0)
+        file.write(''.join(f"{number}\n" for number in numbers))
+
+
+def append_text(path, text):
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(text)
+
+
+def test_incremental_reload_reads_appended_lines_and_finishes_partial_line(work_dir):
+    path = work_dir / 'numbers.txt'
+    path.write_text('1\n2\n3', encoding='utf-8')
+    source = FileNumberDataSource(str(path), incremental=True)
+    assert source.get_numbers() == [1, 2, 3]
+
+    append_text(path, '4\n5\n')
+    assert source.get_numbers() == [1, 2, 34, 5]
+    version = source.get_data_version()
+
+    append_text(path, '6\n')
+    assert source.get_numbers() == [1, 2, 34, 5, 6]
+    # Дописывание целых строк не меняет поколение - кэш агрегатов досчитывает хвост
+    assert source.get_data_version() == version
+
+    write_numbers(path, [9])
+    assert source.get_numbers() == [9]
+
+
+def test_numbers_view_is_read_only_and_shares_the_buffer(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, range(10))
+    source = FileNumberDataSource(str(path))
+
+    view = source.get_numbers_view()
+
+    assert view.readonly
+    assert view.obj is source.numbers
+    assert list(view) == list(range(10))
+
+
+@pytest.mark.parametrize('fast_load', [True, False])
+def test_chunked_parser_handles_lines_split_between_chunks(work_dir, monkeypatch, fast_load):
+    monkeypatch.setattr(FileNumberDataSource, 'CHUNK_SIZE', 7)
+    path = work_dir / 'numbers.txt'
+    path.write_bytes(b'12345\r\n-678\n\nabc\n  90  \n1234567890123\n42')
+
+    source = FileNumberDataSource(str(path), fast_load=fast_load)
+
+    assert source.get_numbers() == [12345, -678, 90, 1234567890123, 42]
+    assert source.invalid_count == 1
+
+
+def test_aggregate_cache_reuses_and_extends_results(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, [5, 1, 9])
+    service = NumberOperationsService(FileNumberDataSource(str(path), incremental=True))
+
+    first = service.get_aggregates()
+    assert service.get_aggregates() is first
+
+    append_text(path, '-4\n')
+    extended = service.get_aggregates()
+    assert (extended.total, extended.minimum, extended.maximum, extended.count) == (11, -4, 9, 4)
+    assert service.get_percentile(50) == pytest.approx(3.0)
+
+    write_numbers(path, [2, 2])
+    assert (service.get_sum(), service.get_count()) == (4, 2)
+
+
+def test_metrics_registry_records_timings_only_when_enabled(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, range(5))
+    metrics.reset()
+    FileNumberDataSource(str(path))
+    assert metrics.to_dict()['histograms'] == {}
+
+    metrics.enable()
+    try:
+        FileNumberDataSource(str(path))
+        metrics.increment('test_events', 2)
+        exported = metrics.to_prometheus()
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+    assert 'number_pipeline_test_events_total 2' in exported
+    assert 'number_pipeline_file_source_load_seconds_count 1' in exported
+
+
+def test_watched_source_picks_up_changes(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, [1])
+    source = FileNumberDataSource(str(path), watch=True, check_interval=0.05)
+    try:
+        time.sleep(0.1)
+        write_numbers(path, [1, 2, 3])
+        deadline = time.monotonic() + 5
+        while source.get_numbers() != [1, 2, 3] and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert source.get_numbers() == [1, 2, 3]
+    finally:
+        source.close()
+
+
+def test_cache_rejected_after_same_inode_rewrite(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, range(20000))
+    FileNumberDataSource(str(path), incremental=True, use_cache=True)
+    inode = path.stat().st_ino
+
+    expected = [number * 7 for number in range(30000)]
+    write_numbers(path, expected)
+    assert path.stat().st_ino == inode
+
+    assert FileNumberDataSource(str(path), incremental=True, use_cache=True).get_numbers() == expected
+    # Кэш, записанный после отказа, тоже должен содержать все числа
+    assert FileNumberDataSource(str(path), incremental=True, use_cache=True).get_numbers() == expected
+
+
+@pytest.mark.parametrize('overflow_policy', ['block', 'drop'])
+def test_logger_keeps_messages_during_reconfigure(work_dir, overflow_policy):
+    logger = Logger()
+    settings = dict(buffered=True, echo=False, max_queue_size=10, overflow_policy=overflow_policy)
+    logger.configure(**settings)
+    logger.dropped_messages = 0
+    errors = []
+
+    def produce(thread_number):
+        try:
+            for index in range(500):
+                logger.log(f"thread {thread_number} message {index}")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=produce, args=(number,), daemon=True) for number in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(20):
+        logger.configure(**settings)
+    for thread in threads:
+        thread.join(timeout=10)
+    assert not any(thread.is_alive() for thread in threads)
+    logger.configure()
+
+    assert not errors
+    lines = (work_dir / logger.log_file).read_text(encoding='utf-8').splitlines()
+    assert sum('message' in line for line in lines) + logger.dropped_messages == 2000
+
+
+def test_aggregates_ignore_stale_version_after_reload(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, [1, 2, 3])
+    source = FileNumberDataSource(str(path))
+    service = NumberOperationsService(source)
+    assert service.get_sum() == 6
+
+    # Перезагрузка между чтением версии и чтением чисел: версия ещё старая, данные уже новые
+    stale_version = source.get_data_version()
+    source.get_data_version = lambda: stale_version
+    write_numbers(path, [100, 200, 300, 400, 500])
+
+    aggregates = service.get_aggregates()
+    assert (aggregates.count, aggregates.total, aggregates.minimum) == (5, 1500, 100)
+    assert service.get_percentile(50) == 300
+    assert service.perform_all_operations()['sum'] == 1500
+
+
+def test_sharded_operations_use_one_snapshot_without_concatenation(work_dir, monkeypatch):
+    shards = work_dir / 'shards'
+    shards.mkdir()
+    write_numbers(shards / 'a.txt', [1, 2, 3])
+    write_numbers(shards / 'b.txt', [10, 20])
+    source = ShardedNumberDataSource(str(shards), max_workers=1)
+    service = NumberOperationsService(source)
+
+    checks = []
+    original_check = source.check_for_updates
+    monkeypatch.setattr(source, 'check_for_updates', lambda: checks.append(1) or original_check())
+    monkeypatch.setattr(source, 'get_numbers_view', lambda: pytest.fail("shards were concatenated"))
+
+    results = service.perform_all_operations()
+    assert list(results['numbers']) == [1, 2, 3, 10, 20]
+    assert (results['sum'], results['count'], results['max']) == (36, 5, 20)
+    assert len(checks) == 1
+    assert service.get_percentile(50) == 3
+    assert results['numbers'][2:4] == [3, 10]
+
+
+def test_sharded_source_throttles_shard_scans(work_dir, monkeypatch):
+    shards = work_dir / 'shards'
+    shards.mkdir()
+    write_numbers(shards / 'a.txt', [1, 2, 3])
+    scans = []
+    monkeypatch.setattr(glob, 'glob', lambda pattern, scan=glob.glob: scans.append(pattern) or scan(pattern))
+    source = DataSourceFactory.create_sharded_data_source(str(shards), max_workers=1, sample_rate=0,
+                                                          check_interval=60)
+    service = NumberOperationsService(source)
+
+    write_numbers(shards / 'b.txt', [10])
+    assert [service.get_sum() for _ in range(5)] == [6] * 5
+    assert len(scans) == 1
+
+    source.invalidate()
+    assert service.get_sum() == 16
+    assert len(scans) == 2
+
+
+def test_streaming_source_does_not_load_the_file(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, range(1, 1001))
+    source = DataSourceFactory.create_streaming_file_data_source(str(path), sample_rate=0)
+    service = NumberOperationsService(source)
+
+    aggregates = service.get_streaming_aggregates(chunk_size=100)
+    assert (aggregates.count, aggregates.total) == (1000, 500500)
+    assert 'not loaded' in source.get_data_source_info()
+
+    assert service.get_count() == 1000
+    assert 'Numbers: 1000' in source.get_data_source_info()
+
+
+def test_proxy_close_writes_last_summary_window(work_dir):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, [1, 2, 3])
+    logger = Logger()
+    logger.configure(echo=False)
+    proxy = LoggingNumberDataSourceProxy(FileNumberDataSource(str(path)), sample_rate=0, summary_interval=3600)
+    for _ in range(3):
+        proxy.get_numbers_view()
+
+    proxy.close()
+    logger.configure()
+    log = (work_dir / logger.log_file).read_text(encoding='utf-8')
+    assert "3 accesses" in log
+
+
+class ListLogger:
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message):
+        self.messages.append(message)
+
+
+@pytest.mark.parametrize('sample_rate, logged', [(1.0, 12), (0.75, 9), (0.6, 8), (0.25, 3), (0.0, 0)])
+def test_proxy_logs_the_requested_fraction_of_accesses(work_dir, sample_rate, logged):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, range(3))
+    proxy = LoggingNumberDataSourceProxy(FileNumberDataSource(str(path)), sample_rate=sample_rate)
+    proxy.logger = ListLogger()
+
+    for _ in range(12):
+        proxy.get_numbers_view()
+
+    assert len(proxy.logger.messages) == 2 * logged
+    assert proxy.total_accesses == 12
+
+
+def test_watcher_treats_queue_overflow_as_a_change():
+    watcher = FileWatcher('numbers.txt', lambda: None)
+    overflow = FileWatcher.EVENT_HEADER.pack(-1, FileWatcher.IN_Q_OVERFLOW, 0, 0)
+    other = FileWatcher.EVENT_HEADER.pack(1, FileWatcher.IN_MODIFY, 0, 16) + b'other.txt'.ljust(16, b'\0')
+
+    assert watcher._parse_events(other, b'numbers.txt') == (False, False)
+    assert watcher._parse_events(other + overflow, b'numbers.txt') == (True, False)
+
+
+def test_watcher_falls_back_to_polling_when_directory_is_removed(work_dir):
+    directory = work_dir / 'data'
+    directory.mkdir()
+    path = directory / 'numbers.txt'
+    write_numbers(path, [1])
+    changes = []
+    watcher = FileWatcher(str(path), lambda: changes.append(time.monotonic()), poll_interval=0.02)
+    watcher.start()
+    try:
+        if watcher.backend != 'inotify':
+            pytest.skip('inotify is not available')
+        path.unlink()
+        directory.rmdir()
+        deadline = time.monotonic() + 5
+        while watcher.backend != 'polling' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert watcher.backend == 'polling' and changes
+
+        seen = len(changes)
+        directory.mkdir()
+        write_numbers(path, [2])
+        while len(changes) == seen and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(changes) > seen
+    finally:
+        watcher.stop()
+
+
+def test_invalidate_during_check_is_not_lost(work_dir, monkeypatch):
+    path = work_dir / 'numbers.txt'
+    write_numbers(path, [1, 2, 3])
+    source = FileNumberDataSource(str(path), check_interval=3600)
+    source.invalidate()
+
+    # invalidate() из потока наблюдателя приходит, пока _check_file решает, нужна ли проверка
+    real_monotonic = time.monotonic
+    watcher_threads = []
+
+    def monotonic_with_invalidate():
+        if not watcher_threads:
+            thread = threading.Thread(target=source.invalidate)
+            watcher_threads.append(thread)
+            thread.start()
+            thread.join(timeout=0.2)
+        return real_monotonic()
+
+    monkeypatch.setattr(time, 'monotonic', monotonic_with_invalidate)
+    source.get_numbers()
+    monkeypatch.setattr(time, 'monotonic', real_monotonic)
+    watcher_threads[0].join()
+
+    write_numbers(path, [4, 5])
+    assert source.get_numbers() == [4, 5]
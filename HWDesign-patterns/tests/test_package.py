@@ -0,0 +1,17 @@
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_importing_modules_has_no_side_effects(work_dir):
+    modules = ['command', 'number_pipeline', 'number_async', 'library', 'builder', 'pasta', 'prototype']
+    code = ''.join(f'import patterns.{module}\n' for module in modules)
+
+    result = subprocess.run([sys.executable, '-c', code], cwd=work_dir, capture_output=True, text=True,
+                            env={'PYTHONPATH': str(PACKAGE_ROOT), 'PYTHONDONTWRITEBYTECODE': '1'}, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == result.stderr == ''
+    assert list(work_dir.iterdir()) == []